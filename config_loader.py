@@ -1,16 +1,126 @@
 """Configuration loader for the Perp DEX Discord Bot."""
 
+import functools
 import os
 import re
 import logging
-from typing import Dict, Any, Optional
-from pathlib import Path
-import yaml
-from dotenv import load_dotenv
+from typing import Callable, Dict, Any, Optional
 
 
 logger = logging.getLogger(__name__)
 
+# Matches ${VAR_NAME} references in config values
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# (key, value) iterators for the container types produced by YAML.
+# Dispatch is on exact type since the safe loader only emits builtins.
+_CONTAINER_ITEMS = {
+    dict: dict.items,
+    list: enumerate,
+}
+
+VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+# JSON Schema for the required configuration structure
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['schedule', 'exchanges', 'analysis', 'discord', 'storage', 'logging'],
+    'properties': {
+        'schedule': {
+            'type': 'object',
+            'required': ['common_pairs_update', 'notification_time'],
+        },
+        'exchanges': {
+            'type': 'array',
+            'minItems': 1,
+            'items': {
+                'type': 'object',
+                'required': ['name', 'type', 'enabled', 'api_base_url'],
+            },
+        },
+        'analysis': {
+            'type': 'object',
+            'required': ['fr_divergence', 'oi_ratio'],
+        },
+        'discord': {
+            'type': 'object',
+            'required': ['webhook_url'],
+            'properties': {
+                'webhook_url': {'type': 'string', 'pattern': r'\S'},
+            },
+        },
+        'storage': {
+            'type': 'object',
+            'required': ['cache_file'],
+        },
+        'logging': {
+            'type': 'object',
+            'required': ['level', 'file'],
+            'properties': {
+                'level': {'enum': VALID_LOG_LEVELS},
+            },
+        },
+    },
+}
+
+# User-facing messages for missing required keys, by schema location
+_REQUIRED_MESSAGES = {
+    'data': "Missing required section in config: '{}'",
+    'data.schedule': "Schedule missing '{}'",
+    'data.analysis': "Analysis missing '{}' section",
+    'data.discord': "Discord section missing '{}'",
+    'data.storage': "Storage section missing '{}'",
+    'data.logging': "Logging section missing '{}'",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_validator() -> Callable[[Dict[str, Any]], Any]:
+    """
+    Compile CONFIG_SCHEMA on first use and reuse the validator afterwards.
+
+    fastjsonschema is imported here so importing this module stays cheap.
+
+    Returns:
+        Callable: Compiled validator raising JsonSchemaValueException on failure
+    """
+    import fastjsonschema
+    return fastjsonschema.compile(CONFIG_SCHEMA)
+
+
+def _schema_error_message(error: Any) -> str:
+    """
+    Turn a schema validation error into an actionable message.
+
+    Args:
+        error: fastjsonschema.JsonSchemaValueException raised by the validator
+
+    Returns:
+        str: Message naming the missing or invalid setting
+    """
+    name, rule, value = error.name, error.rule, error.value
+
+    if rule == 'required':
+        missing = next(key for key in error.rule_definition if key not in value)
+        if name.startswith('data.exchanges['):
+            return f"Exchange missing required field: '{missing}'"
+        if name in _REQUIRED_MESSAGES:
+            return _REQUIRED_MESSAGES[name].format(missing)
+
+    if name == 'data.exchanges' and rule == 'minItems':
+        return "No exchanges configured"
+
+    if name == 'data.discord.webhook_url':
+        return "Discord webhook_url is empty"
+
+    if name == 'data.logging.level' and rule == 'enum':
+        return (
+            f"Invalid log level: '{value}'. "
+            f"Valid levels: {', '.join(VALID_LOG_LEVELS)}"
+        )
+
+    return f"Invalid configuration: {error.message}"
+
 
 class ConfigLoader:
     """Configuration loader with environment variable expansion and validation."""
@@ -24,6 +134,7 @@ class ConfigLoader:
         """
         self.config_path = config_path
         self._config: Optional[Dict[str, Any]] = None
+        self._resolved: Dict[str, Any] = {}
 
     def load(self) -> Dict[str, Any]:
         """
@@ -37,35 +148,44 @@ class ConfigLoader:
             yaml.YAMLError: If config file is invalid YAML
             ValueError: If required environment variables are missing
         """
+        # dotenv and yaml are only needed here, so import them on first use
+        from dotenv import load_dotenv
+        import yaml
+
         # Load environment variables from .env file
         load_dotenv()
 
-        # Check if config file exists
-        if not Path(self.config_path).exists():
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+        # Prefer the LibYAML-backed loader when available
+        yaml_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
         # Load YAML
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=yaml_loader)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {self.config_path}") from None
 
-        # Expand environment variables
-        config = self._expand_env_vars(config)
+        # Expand environment variables (snapshot the environment once)
+        config = self._expand_env_vars(config, dict(os.environ))
 
         # Validate configuration
         self._validate_config(config)
 
         self._config = config
+        self._resolved.clear()
         logger.info(f"Configuration loaded successfully from {self.config_path}")
         return config
 
-    def _expand_env_vars(self, obj: Any) -> Any:
+    def _expand_env_vars(self, obj: Any, env: Optional[Dict[str, str]] = None) -> Any:
         """
-        Recursively expand environment variables in configuration.
+        Expand environment variables in configuration.
 
-        Supports ${VAR_NAME} syntax.
+        Supports ${VAR_NAME} syntax. Nested dicts and lists are walked
+        iteratively and updated in place.
 
         Args:
             obj: Configuration object (dict, list, str, etc.)
+            env: Environment variable snapshot (default: current os.environ)
 
         Returns:
             Any: Configuration with environment variables expanded
@@ -73,27 +193,57 @@ class ConfigLoader:
         Raises:
             ValueError: If required environment variable is not set
         """
-        if isinstance(obj, dict):
-            return {k: self._expand_env_vars(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._expand_env_vars(item) for item in obj]
-        elif isinstance(obj, str):
-            # Find all ${VAR_NAME} patterns
-            pattern = r'\$\{([^}]+)\}'
-            matches = re.findall(pattern, obj)
-
-            for var_name in matches:
-                env_value = os.getenv(var_name)
-                if env_value is None:
-                    raise ValueError(
-                        f"Environment variable '{var_name}' is not set. "
-                        f"Please set it in your .env file or environment."
-                    )
-                obj = obj.replace(f'${{{var_name}}}', env_value)
+        if env is None:
+            env = dict(os.environ)
 
+        obj_type = type(obj)
+        if obj_type is str:
+            return self._expand_str(obj, env)
+        if obj_type not in _CONTAINER_ITEMS:
             return obj
-        else:
-            return obj
+
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            for key, value in _CONTAINER_ITEMS[type(node)](node):
+                value_type = type(value)
+                if value_type in _CONTAINER_ITEMS:
+                    stack.append(value)
+                elif value_type is str:
+                    node[key] = self._expand_str(value, env)
+
+        return obj
+
+    def _expand_str(self, value: str, env: Dict[str, str]) -> str:
+        """
+        Expand environment variables in a single string value.
+
+        Args:
+            value: String that may contain ${VAR_NAME} references
+            env: Environment variable snapshot
+
+        Returns:
+            str: String with environment variables expanded
+
+        Raises:
+            ValueError: If required environment variable is not set
+        """
+        # Most values contain no variable reference, skip the regex for those
+        if '${' not in value:
+            return value
+
+        # Replace all ${VAR_NAME} patterns in a single pass
+        def _substitute(match: re.Match) -> str:
+            var_name = match.group(1)
+            env_value = env.get(var_name)
+            if env_value is None:
+                raise ValueError(
+                    f"Environment variable '{var_name}' is not set. "
+                    f"Please set it in your .env file or environment."
+                )
+            return env_value
+
+        return _ENV_VAR_PATTERN.sub(_substitute, value)
 
     def _validate_config(self, config: Dict[str, Any]) -> None:
         """
@@ -105,66 +255,17 @@ class ConfigLoader:
         Raises:
             ValueError: If configuration is invalid
         """
-        # Check top-level sections
-        required_sections = ['schedule', 'exchanges', 'analysis', 'discord', 'storage', 'logging']
-        for section in required_sections:
-            if section not in config:
-                raise ValueError(f"Missing required section in config: '{section}'")
-
-        # Validate exchanges
-        if not config['exchanges']:
-            raise ValueError("No exchanges configured")
-
-        for exchange in config['exchanges']:
-            required_fields = ['name', 'type', 'enabled', 'api_base_url']
-            for field in required_fields:
-                if field not in exchange:
-                    raise ValueError(f"Exchange missing required field: '{field}'")
-
-        # Validate schedule
-        schedule = config['schedule']
-        if 'common_pairs_update' not in schedule:
-            raise ValueError("Schedule missing 'common_pairs_update'")
-        if 'notification_time' not in schedule:
-            raise ValueError("Schedule missing 'notification_time'")
-
-        # Validate analysis parameters
-        analysis = config['analysis']
-        if 'fr_divergence' not in analysis:
-            raise ValueError("Analysis missing 'fr_divergence' section")
-        if 'oi_ratio' not in analysis:
-            raise ValueError("Analysis missing 'oi_ratio' section")
-
-        # Validate Discord webhook URL
-        discord = config['discord']
-        if 'webhook_url' not in discord:
-            raise ValueError("Discord section missing 'webhook_url'")
-
-        webhook_url = discord['webhook_url']
-        if not webhook_url or webhook_url.strip() == '':
-            raise ValueError("Discord webhook_url is empty")
+        import fastjsonschema
+
+        try:
+            _schema_validator()(config)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValueError(_schema_error_message(e)) from e
+
+        webhook_url = config['discord']['webhook_url']
         if not webhook_url.startswith('https://discord.com/api/webhooks/'):
             logger.warning(f"Discord webhook URL format may be invalid: {webhook_url}")
 
-        # Validate storage
-        storage = config['storage']
-        if 'cache_file' not in storage:
-            raise ValueError("Storage section missing 'cache_file'")
-
-        # Validate logging
-        logging_config = config['logging']
-        if 'level' not in logging_config:
-            raise ValueError("Logging section missing 'level'")
-        if 'file' not in logging_config:
-            raise ValueError("Logging section missing 'file'")
-
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if logging_config['level'] not in valid_log_levels:
-            raise ValueError(
-                f"Invalid log level: '{logging_config['level']}'. "
-                f"Valid levels: {', '.join(valid_log_levels)}"
-            )
-
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a configuration value by key.
@@ -179,15 +280,18 @@ class ConfigLoader:
         if self._config is None:
             raise RuntimeError("Configuration not loaded. Call load() first.")
 
-        keys = key.split('.')
-        value = self._config
+        # Resolved paths are memoized until the next load()
+        if key in self._resolved:
+            return self._resolved[key]
 
-        for k in keys:
-            if isinstance(value, dict) and k in value:
+        value = self._config
+        try:
+            for k in key.split('.'):
                 value = value[k]
-            else:
-                return default
+        except (KeyError, TypeError):
+            return default
 
+        self._resolved[key] = value
         return value
 
     def get_enabled_exchanges(self) -> list:
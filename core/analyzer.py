@@ -1,12 +1,18 @@
 """Market data analysis for the Perp DEX Discord Bot."""
 
+import heapq
 import logging
+from dataclasses import asdict
+from operator import attrgetter
 from typing import List, Dict
-from .types import MarketData
+from .types import MarketData, FRDivergence, LowOIRatio
 
 
 logger = logging.getLogger(__name__)
 
+# Fields read for every market in find_low_oi_ratio
+_oi_ratio_fields = attrgetter('volume_24h', 'open_interest', 'funding_rate', 'symbol')
+
 
 class MarketAnalyzer:
     """Market data analysis class for analyzing funding rates and OI ratios."""
@@ -42,18 +48,18 @@ class MarketAnalyzer:
                 ...
             ]
         """
-        # Build symbol-indexed maps for both exchanges
+        # Index exchange A by symbol and stream exchange B against it.
+        # Matched symbols are popped so each pair is emitted once, and B is
+        # walked in reverse so its last listing wins as in a dict build.
         markets_a_map = {m.symbol: m for m in markets_a}
-        markets_b_map = {m.symbol: m for m in markets_b}
-
-        # Find common symbols
-        common_symbols = set(markets_a_map.keys()) & set(markets_b_map.keys())
 
         divergences = []
 
-        for symbol in common_symbols:
-            market_a = markets_a_map[symbol]
-            market_b = markets_b_map[symbol]
+        for market_b in reversed(markets_b):
+            symbol = market_b.symbol
+            market_a = markets_a_map.pop(symbol, None)
+            if market_a is None:
+                continue
 
             # Filter by minimum volume (use average of both exchanges)
             avg_volume = (market_a.volume_24h + market_b.volume_24h) / 2
@@ -61,23 +67,25 @@ class MarketAnalyzer:
                 continue
 
             # Calculate FR difference (absolute value)
-            fr_diff = abs(market_a.funding_rate - market_b.funding_rate)
-
-            divergences.append({
-                'symbol': symbol,
-                'exchange_a': market_a.exchange,
-                'fr_a': market_a.funding_rate,
-                'exchange_b': market_b.exchange,
-                'fr_b': market_b.funding_rate,
-                'fr_diff': fr_diff,
-                'volume_24h': avg_volume
-            })
-
-        # Sort by FR difference (descending)
-        divergences.sort(key=lambda x: x['fr_diff'], reverse=True)
-
-        # Return top N
-        result = divergences[:top_n]
+            fr_a = market_a.funding_rate
+            fr_b = market_b.funding_rate
+            fr_diff = abs(fr_a - fr_b)
+
+            divergences.append(FRDivergence(
+                symbol=symbol,
+                exchange_a=market_a.exchange,
+                fr_a=fr_a,
+                exchange_b=market_b.exchange,
+                fr_b=fr_b,
+                fr_diff=fr_diff,
+                volume_24h=avg_volume
+            ))
+
+        # Select top N by FR difference (descending)
+        top = heapq.nlargest(top_n, divergences, key=attrgetter('fr_diff'))
+
+        # Callers consume plain dicts
+        result = [asdict(row) for row in top]
 
         logger.info(
             f"Found {len(result)} FR divergence pairs "
@@ -117,41 +125,59 @@ class MarketAnalyzer:
                 ...
             ]
         """
-        candidates = []
+        # Bounded max-heap holding the best top_n rows, keyed on
+        # (-ratio, -index) so ties keep the earliest market like a stable sort
+        heap = []
+        candidate_count = 0
+
+        get_fields = _oi_ratio_fields
+
+        for index, market in enumerate(markets):
+            volume, open_interest, funding_rate, symbol = get_fields(market)
 
-        for market in markets:
             # Filter by volume range
-            if market.volume_24h < min_volume or market.volume_24h > max_volume:
+            if volume < min_volume or volume > max_volume:
                 continue
 
             # Calculate OI / Volume ratio
             # Avoid division by zero
-            if market.volume_24h == 0:
+            if volume == 0:
                 continue
 
-            oi_volume_ratio = market.open_interest / market.volume_24h
+            oi_volume_ratio = open_interest / volume
 
             # Filter by OI ratio
             if oi_volume_ratio > max_oi_ratio:
                 continue
 
-            candidates.append({
-                'symbol': market.symbol,
-                'volume_24h': market.volume_24h,
-                'open_interest': market.open_interest,
-                'oi_volume_ratio': oi_volume_ratio,
-                'funding_rate': market.funding_rate
-            })
+            candidate_count += 1
+
+            # Skip rows that cannot displace the current worst entry
+            if top_n <= 0 or (len(heap) >= top_n and oi_volume_ratio >= -heap[0][0]):
+                continue
+
+            entry = (-oi_volume_ratio, -index, LowOIRatio(
+                symbol=symbol,
+                volume_24h=volume,
+                open_interest=open_interest,
+                oi_volume_ratio=oi_volume_ratio,
+                funding_rate=funding_rate
+            ))
+
+            if len(heap) < top_n:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heapreplace(heap, entry)
 
-        # Sort by OI ratio (ascending - lowest first)
-        candidates.sort(key=lambda x: x['oi_volume_ratio'])
+        # Order by OI ratio (ascending - lowest first)
+        top = [row for _, _, row in sorted(heap, reverse=True)]
 
-        # Return top N
-        result = candidates[:top_n]
+        # Callers consume plain dicts
+        result = [asdict(row) for row in top]
 
         logger.info(
             f"Found {len(result)} low OI ratio pairs "
-            f"(filtered from {len(candidates)} candidates)"
+            f"(filtered from {candidate_count} candidates)"
         )
 
         return result
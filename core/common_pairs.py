@@ -3,6 +3,7 @@
 import logging
 from typing import List, Set, Optional
 from storage.cache import CacheManager
+from .types import MarketData
 
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,22 @@ class CommonPairsManager:
             cache_file: Path to the cache file for storing common pairs
         """
         self.cache_manager = CacheManager(cache_file)
+        # Most recently saved or loaded common pairs
+        self._cached: Optional[List[str]] = None
+
+    @property
+    def current(self) -> Optional[List[str]]:
+        """
+        Common pairs most recently saved or loaded by this manager.
+
+        Falls back to reading the cache file if nothing is held in memory yet.
+
+        Returns:
+            Optional[List[str]]: List of common pairs, or None if cache doesn't exist
+        """
+        if self._cached is None:
+            return self.load_from_cache()
+        return self._cached
 
     def find_common_pairs(self, symbol_lists: List[List[str]]) -> List[str]:
         """
@@ -54,13 +71,10 @@ class CommonPairsManager:
             logger.warning("Not enough non-empty symbol lists")
             return []
 
-        # Convert all lists to sets
-        symbol_sets = [set(symbols) for symbols in symbol_lists]
-
-        # Find intersection (common symbols)
-        common_symbols = symbol_sets[0]
-        for symbol_set in symbol_sets[1:]:
-            common_symbols = common_symbols.intersection(symbol_set)
+        # Find intersection (common symbols), starting from the shortest list
+        symbol_lists.sort(key=len)
+        common_symbols = set(symbol_lists[0])
+        common_symbols.intersection_update(*symbol_lists[1:])
 
         # Convert to sorted list
         result = sorted(common_symbols)
@@ -81,8 +95,8 @@ class CommonPairsManager:
                     {
                         'name': 'Extended',
                         'markets': [
-                            {'symbol': 'BTC-USD', ...},
-                            {'symbol': 'ETH-USD', ...}
+                            MarketData(symbol='BTC-USD', ...),
+                            MarketData(symbol='ETH-USD', ...)
                         ]
                     },
                     ...
@@ -101,9 +115,8 @@ class CommonPairsManager:
                 logger.warning(f"No markets found for exchange: {exchange_name}")
                 continue
 
-            # Extract symbols
-            # markets is a list of MarketData objects, not dicts
-            symbols = [market.symbol for market in markets if hasattr(market, 'symbol')]
+            # Extract symbols (every exchange returns MarketData objects)
+            symbols = [market.symbol for market in markets]
             symbol_lists.append(symbols)
 
             logger.debug(f"{exchange_name}: {len(symbols)} markets")
@@ -121,12 +134,26 @@ class CommonPairsManager:
         Returns:
             bool: True if save was successful, False otherwise
         """
-        data = {
-            'pairs': common_pairs,
-            'count': len(common_pairs)
-        }
+        success = self.cache_manager.save(self._to_cache_data(common_pairs), metadata)
+        if success:
+            self._cached = common_pairs
+        return success
+
+    async def asave_to_cache(self, common_pairs: List[str], metadata: Optional[dict] = None) -> bool:
+        """
+        Save common pairs to cache file without blocking the event loop.
+
+        Args:
+            common_pairs: List of common symbols
+            metadata: Optional metadata (e.g., exchange names, count)
 
-        return self.cache_manager.save(data, metadata)
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        success = await self.cache_manager.asave(self._to_cache_data(common_pairs), metadata)
+        if success:
+            self._cached = common_pairs
+        return success
 
     def load_from_cache(self) -> Optional[List[str]]:
         """
@@ -135,8 +162,50 @@ class CommonPairsManager:
         Returns:
             Optional[List[str]]: List of common pairs, or None if cache doesn't exist
         """
-        cache_data = self.cache_manager.load()
+        pairs = self._pairs_from_cache(self.cache_manager.load())
+        if pairs is not None:
+            self._cached = pairs
+        return pairs
+
+    async def aload_from_cache(self) -> Optional[List[str]]:
+        """
+        Load common pairs from cache file without blocking the event loop.
 
+        Returns:
+            Optional[List[str]]: List of common pairs, or None if cache doesn't exist
+        """
+        pairs = self._pairs_from_cache(await self.cache_manager.aload())
+        if pairs is not None:
+            self._cached = pairs
+        return pairs
+
+    @staticmethod
+    def _to_cache_data(common_pairs: List[str]) -> dict:
+        """
+        Build the cached data structure for a list of common pairs.
+
+        Args:
+            common_pairs: List of common symbols
+
+        Returns:
+            dict: Data to store in the cache
+        """
+        return {
+            'pairs': common_pairs,
+            'count': len(common_pairs)
+        }
+
+    @staticmethod
+    def _pairs_from_cache(cache_data: Optional[dict]) -> Optional[List[str]]:
+        """
+        Extract common pairs from loaded cache data.
+
+        Args:
+            cache_data: Cache data returned by CacheManager, or None
+
+        Returns:
+            Optional[List[str]]: List of common pairs, or None if there is no cache data
+        """
         if not cache_data:
             return None
 
@@ -186,6 +255,7 @@ class CommonPairsManager:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
+        self._cached = None
         return self.cache_manager.delete()
 
 
@@ -268,17 +338,17 @@ def _test_common_pairs():
         {
             'name': 'Extended',
             'markets': [
-                {'symbol': 'BTC-USD', 'volume_24h': 1000000},
-                {'symbol': 'ETH-USD', 'volume_24h': 500000},
-                {'symbol': 'SOL-USD', 'volume_24h': 200000}
+                MarketData('BTC-USD', 'Extended', 1000000, 0.0001, 0),
+                MarketData('ETH-USD', 'Extended', 500000, 0.0001, 0),
+                MarketData('SOL-USD', 'Extended', 200000, 0.0001, 0)
             ]
         },
         {
             'name': 'Lighter',
             'markets': [
-                {'symbol': 'BTC-USD', 'volume_24h': 800000},
-                {'symbol': 'ETH-USD', 'volume_24h': 400000},
-                {'symbol': 'DOGE-USD', 'volume_24h': 100000}
+                MarketData('BTC-USD', 'Lighter', 800000, 0.0001, 0),
+                MarketData('ETH-USD', 'Lighter', 400000, 0.0001, 0),
+                MarketData('DOGE-USD', 'Lighter', 100000, 0.0001, 0)
             ]
         }
     ]
@@ -0,0 +1,55 @@
+"""HTTP helpers shared by the exchange clients and the Discord notifier."""
+
+from typing import Optional
+import aiohttp
+
+# aiodns enables aiohttp's asynchronous DNS resolver; without it the
+# connector falls back to the default threaded resolver
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+# Headers for pre-encoded JSON request bodies (not set on shared sessions)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def create_connector(limit: int, limit_per_host: int) -> aiohttp.TCPConnector:
+    """
+    Create a TCP connector with DNS caching and keep-alive for long-lived sessions.
+
+    Args:
+        limit: Maximum number of simultaneous connections
+        limit_per_host: Maximum number of simultaneous connections per host
+
+    Returns:
+        aiohttp.TCPConnector: Connector using the async resolver when aiodns
+            is installed
+    """
+    return aiohttp.TCPConnector(
+        resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+        limit=limit,
+        limit_per_host=limit_per_host,
+        use_dns_cache=True,
+        ttl_dns_cache=600,
+        keepalive_timeout=75
+    )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value (e.g., "2" or "0.5")
+
+    Returns:
+        Optional[float]: Delay in seconds, or None if missing or not numeric
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketData:
     """Market data representation."""
     symbol: str               # Normalized symbol (e.g., 'BTC-USD')
@@ -15,7 +15,7 @@ class MarketData:
     last_price: Optional[float] = None  # Last price
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FRDivergence:
     """Funding rate divergence analysis result."""
     symbol: str
@@ -27,7 +27,7 @@ class FRDivergence:
     volume_24h: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LowOIRatio:
     """Low OI ratio analysis result."""
     symbol: str
@@ -35,3 +35,20 @@ class LowOIRatio:
     open_interest: float
     oi_volume_ratio: float
     funding_rate: float
+
+
+@dataclass(slots=True, frozen=True)
+class FRConfig:
+    """FR divergence analysis parameters."""
+    min_volume: float         # Minimum 24h volume (USD)
+    top_n: int                # Number of results
+
+
+@dataclass(slots=True, frozen=True)
+class OIConfig:
+    """Low OI ratio analysis parameters."""
+    min_volume: float         # Minimum 24h volume (USD)
+    max_volume: float         # Maximum 24h volume (USD)
+    top_n: int                # Number of results
+    base_exchange: str        # Exchange whose markets are analyzed
+    max_oi_ratio: float = 1.0  # Maximum OI/volume ratio
@@ -1,13 +1,87 @@
-"""Base exchange abstract class for the Perp DEX Discord Bot."""
+"""Base exchange class for the Perp DEX Discord Bot."""
 
-from abc import ABC, abstractmethod
-from typing import List, Dict
+import asyncio
+import functools
+import logging
+import random
+import weakref
+from typing import Awaitable, Callable, List, Dict, Optional
+import aiohttp
+from core.types import MarketData
 
 
-class BaseExchange(ABC):
-    """Abstract base class for all exchange implementations."""
+logger = logging.getLogger(__name__)
 
-    def __init__(self, config: Dict):
+
+def retry_backoff(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """
+    Compute a retry delay using exponential backoff with full jitter.
+
+    The delay is drawn uniformly from [0, min(max_delay, base_delay * 2**attempt)],
+    so clients that fail together do not all retry at the same moment.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        base_delay: Upper bound of the first delay in seconds
+        max_delay: Cap on the upper bound in seconds
+
+    Returns:
+        float: Delay in seconds
+    """
+    return random.uniform(0, min(max_delay, base_delay * (1 << attempt)))
+
+
+def _warn_unclosed_session(session: aiohttp.ClientSession, exchange_name: str) -> None:
+    """Log a warning if an exchange was discarded with its session still open."""
+    if not session.closed:
+        logger.warning(
+            f"{exchange_name} was garbage collected with an open HTTP session; "
+            f"use 'async with' or call close()"
+        )
+
+
+def single_flight(
+    method: Callable[['BaseExchange'], Awaitable[List[MarketData]]]
+) -> Callable[['BaseExchange'], Awaitable[List[MarketData]]]:
+    """
+    Coalesce concurrent calls of an exchange's get_markets().
+
+    While a fetch is in flight, further callers await the same task instead
+    of issuing duplicate requests. The task is shielded, so cancelling one
+    caller does not cancel the fetch for the others.
+
+    Args:
+        method: get_markets() implementation to wrap
+
+    Returns:
+        Callable: Wrapped coroutine function
+    """
+    @functools.wraps(method)
+    async def wrapper(self: 'BaseExchange') -> List[MarketData]:
+        task = self._inflight_markets
+        if task is None:
+            task = asyncio.ensure_future(method(self))
+            self._inflight_markets = task
+
+            def _clear(done: asyncio.Future) -> None:
+                if self._inflight_markets is done:
+                    self._inflight_markets = None
+
+            task.add_done_callback(_clear)
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+class BaseExchange:
+    """
+    Base class for all exchange implementations.
+
+    Subclasses must override get_markets() and normalize_symbol().
+    Decorating get_markets() with @single_flight coalesces concurrent calls.
+    """
+
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the exchange with configuration.
 
@@ -16,31 +90,71 @@ class BaseExchange(ABC):
                 - name: Exchange name
                 - api_base_url: Base URL for the API
                 - config: Exchange-specific configuration
+            session: Shared HTTP session (optional). If omitted, the
+                exchange creates and owns its own session.
         """
         self.name = config['name']
         self.api_base_url = config['api_base_url']
         self.config = config.get('config', {})
+        self._session = session
+        self._owns_session = session is None
+        self._inflight_markets: Optional[asyncio.Future] = None
+        self._session_finalizer: Optional[weakref.finalize] = None
+
+    def _adopt_session(self, session: aiohttp.ClientSession) -> aiohttp.ClientSession:
+        """
+        Take ownership of a session created by this exchange.
+
+        The session is closed by close(), and a warning is logged if the
+        exchange is garbage collected before that happens.
+
+        Args:
+            session: Newly created HTTP session
+
+        Returns:
+            aiohttp.ClientSession: The same session
+        """
+        self._session = session
+        self._owns_session = True
+        # Only the current session needs watching; drop the replaced one's finalizer
+        if self._session_finalizer is not None:
+            self._session_finalizer.detach()
+        self._session_finalizer = weakref.finalize(self, _warn_unclosed_session, session, self.name)
+        return session
+
+    async def close(self):
+        """Close the HTTP session if it was created by this exchange."""
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        """Enter the async context; the exchange is closed on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the exchange when leaving the async context."""
+        await self.close()
 
-    @abstractmethod
-    async def get_markets(self) -> List[Dict]:
+    async def get_markets(self) -> List[MarketData]:
         """
         Fetch all market information from the exchange.
 
         Returns:
-            List[Dict]: List of market information dictionaries
+            List[MarketData]: List of market data objects
             [
-                {
-                    'symbol': 'BTC-USD',
-                    'volume_24h': 1500000.0,  # USD
-                    'funding_rate': 0.0001,    # 0.01%
-                    'open_interest': 50000000.0  # USD
-                },
+                MarketData(
+                    symbol='BTC-USD',
+                    exchange='Extended',
+                    volume_24h=1500000.0,      # USD
+                    funding_rate=0.0001,       # 0.01%
+                    open_interest=50000000.0,  # USD
+                    last_price=60000.0
+                ),
                 ...
             ]
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement get_markets()")
 
-    @abstractmethod
     def normalize_symbol(self, raw_symbol: str) -> str:
         """
         Normalize exchange-specific symbol format to a common format.
@@ -51,4 +165,4 @@ class BaseExchange(ABC):
         Returns:
             str: Normalized symbol (e.g., 'BTC-USD')
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement normalize_symbol()")
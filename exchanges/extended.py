@@ -1,32 +1,73 @@
 """Extended Exchange implementation for the Perp DEX Discord Bot."""
 
 import asyncio
+import functools
 import logging
 from typing import List, Dict, Optional
 import aiohttp
-from .base import BaseExchange
+import orjson
+from .base import BaseExchange, retry_backoff, single_flight
 from core.types import MarketData
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=2048)
+def _normalize_extended_symbol(raw_symbol: str) -> str:
+    """
+    Normalize an Extended symbol, caching the result.
+
+    The symbol universe is small and stable across polls, so each
+    distinct name is only converted once.
+
+    Args:
+        raw_symbol: Extended symbol (e.g., "BTC-USD")
+
+    Returns:
+        str: Normalized symbol (e.g., "BTC-USD")
+    """
+    # Extended already uses the standard format
+    return raw_symbol.upper()
+
+
 class ExtendedExchange(BaseExchange):
     """Extended Exchange (Starknet) implementation."""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize Extended Exchange.
 
         Args:
             config: Exchange configuration dictionary
+            session: Shared HTTP session (optional)
         """
-        super().__init__(config)
+        super().__init__(config, session)
         self.rate_limit = self.config.get('rate_limit', 1000)
         self.timeout = aiohttp.ClientTimeout(total=30)
         self.max_retries = 3
         self.retry_delay = 1  # Initial retry delay in seconds
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Session reused across requests
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            return self._adopt_session(aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector
+            ))
+        return self._session
+
+    @single_flight
     async def get_markets(self) -> List[MarketData]:
         """
         Fetch all market information from Extended Exchange.
@@ -38,36 +79,32 @@ class ExtendedExchange(BaseExchange):
 
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.get(url) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                        # Validate response status (case-insensitive)
-                        status = data.get('status', '').lower()
-                        if status not in ['ok', 'success']:
-                            logger.warning(f"Extended API returned non-ok status: {data.get('status')}")
-                            return []
-
-                        # Parse markets
-                        markets = []
-                        for market in data.get('data', []):
-                            try:
-                                parsed_market = self._parse_market(market)
-                                if parsed_market:
-                                    markets.append(parsed_market)
-                            except Exception as e:
-                                logger.warning(f"Failed to parse market {market.get('name')}: {e}")
-                                continue
-
-                        logger.info(f"Successfully fetched {len(markets)} markets from Extended")
-                        return markets
+                session = await self._get_session()
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    data = await response.json(loads=orjson.loads)
+
+                    # Validate response status (case-insensitive)
+                    status = data.get('status', '').lower()
+                    if status not in ['ok', 'success']:
+                        logger.warning(f"Extended API returned non-ok status: {data.get('status')}")
+                        return []
+
+                    # Parse markets; invalid entries come back as None and
+                    # anything unexpected is handled once below
+                    markets = [
+                        parsed_market for market in data.get('data', [])
+                        if (parsed_market := self._parse_market(market)) is not None
+                    ]
+
+                    logger.info(f"Successfully fetched {len(markets)} markets from Extended")
+                    return markets
 
             except aiohttp.ClientError as e:
                 logger.warning(f"Extended API request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {delay} seconds...")
+                    delay = retry_backoff(attempt, self.retry_delay)  # Jittered exponential backoff
+                    logger.info(f"Retrying in {delay:.2f} seconds...")
                     await asyncio.sleep(delay)
                 else:
                     logger.error(f"Extended API request failed after {self.max_retries} attempts")
@@ -98,9 +135,15 @@ class ExtendedExchange(BaseExchange):
             open_interest = market_stats.get('openInterest')
             last_price = market_stats.get('lastPrice')
 
-            # Check for missing data
-            if not all([name, daily_volume, funding_rate, open_interest, last_price]):
-                logger.debug(f"Skipping market {name} due to missing data")
+            # Check for missing data (a zero funding rate is still valid)
+            if (
+                name is None
+                or daily_volume is None
+                or funding_rate is None
+                or open_interest is None
+                or last_price is None
+            ):
+                logger.debug("Skipping market %s due to missing data", name)
                 return None
 
             # Convert strings to floats
@@ -115,7 +158,7 @@ class ExtendedExchange(BaseExchange):
 
             # Validate values
             if volume_24h < 0 or oi_usd < 0:
-                logger.debug(f"Skipping market {name} due to invalid values")
+                logger.debug("Skipping market %s due to invalid values", name)
                 return None
 
             # Normalize symbol
@@ -130,8 +173,8 @@ class ExtendedExchange(BaseExchange):
                 last_price=price
             )
 
-        except (ValueError, TypeError) as e:
-            logger.debug(f"Error parsing market data: {e}")
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.debug("Error parsing market data: %s", e)
             return None
 
     def normalize_symbol(self, raw_symbol: str) -> str:
@@ -146,8 +189,7 @@ class ExtendedExchange(BaseExchange):
         Returns:
             str: Normalized symbol (e.g., "BTC-USD")
         """
-        # Extended already uses the standard format
-        return raw_symbol.upper()
+        return _normalize_extended_symbol(raw_symbol)
 
 
 # Test stub function
@@ -164,38 +206,37 @@ async def _test_extended():
         }
     }
 
-    # Create exchange instance
-    exchange = ExtendedExchange(config)
-
-    # Test normalize_symbol
-    print("\nTesting normalize_symbol():")
-    test_symbols = ["BTC-USD", "eth-usd", "SOL-USD"]
-    for symbol in test_symbols:
-        normalized = exchange.normalize_symbol(symbol)
-        print(f"  {symbol} -> {normalized}")
-
-    # Test get_markets
-    print("\nTesting get_markets():")
-    try:
-        markets = await exchange.get_markets()
-        print(f"  Fetched {len(markets)} markets")
-
-        # Display first 3 markets
-        if markets:
-            print("\nFirst 3 markets:")
-            for market in markets[:3]:
-                print(f"  Symbol: {market.symbol}")
-                print(f"    Exchange: {market.exchange}")
-                print(f"    Volume 24h: ${market.volume_24h:,.2f}")
-                print(f"    Funding Rate: {market.funding_rate:.4%}")
-                print(f"    Open Interest: ${market.open_interest:,.2f}")
-                if market.last_price:
-                    print(f"    Last Price: ${market.last_price:,.2f}")
-                print()
-    except Exception as e:
-        print(f"  Error: {e}")
-        import traceback
-        traceback.print_exc()
+    # Create exchange instance (closed when the block exits)
+    async with ExtendedExchange(config) as exchange:
+        # Test normalize_symbol
+        print("\nTesting normalize_symbol():")
+        test_symbols = ["BTC-USD", "eth-usd", "SOL-USD"]
+        for symbol in test_symbols:
+            normalized = exchange.normalize_symbol(symbol)
+            print(f"  {symbol} -> {normalized}")
+
+        # Test get_markets
+        print("\nTesting get_markets():")
+        try:
+            markets = await exchange.get_markets()
+            print(f"  Fetched {len(markets)} markets")
+
+            # Display first 3 markets
+            if markets:
+                print("\nFirst 3 markets:")
+                for market in markets[:3]:
+                    print(f"  Symbol: {market.symbol}")
+                    print(f"    Exchange: {market.exchange}")
+                    print(f"    Volume 24h: ${market.volume_24h:,.2f}")
+                    print(f"    Funding Rate: {market.funding_rate:.4%}")
+                    print(f"    Open Interest: ${market.open_interest:,.2f}")
+                    if market.last_price:
+                        print(f"    Last Price: ${market.last_price:,.2f}")
+                    print()
+        except Exception as e:
+            print(f"  Error: {e}")
+            import traceback
+            traceback.print_exc()
 
 
 if __name__ == '__main__':
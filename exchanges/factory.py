@@ -1,16 +1,25 @@
 """Exchange factory for the Perp DEX Discord Bot."""
 
-from typing import Dict, Type
+import asyncio
+import logging
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Type
+import aiohttp
 from .base import BaseExchange
 from .extended import ExtendedExchange
 from .lighter import LighterExchange
 from .grvt import GRVTExchange
+from core.types import MarketData
+
+
+logger = logging.getLogger(__name__)
 
 
 class ExchangeFactory:
     """Factory class for creating exchange instances."""
 
-    _registry: Dict[str, Type[BaseExchange]] = {
+    # Becomes a read-only MappingProxyType once freeze() is called
+    _registry: Mapping[str, Type[BaseExchange]] = {
         'extended': ExtendedExchange,
         'lighter': LighterExchange,
         'grvt': GRVTExchange,
@@ -18,7 +27,11 @@ class ExchangeFactory:
     }
 
     @classmethod
-    def create(cls, config: Dict) -> BaseExchange:
+    def create(
+        cls,
+        config: Dict,
+        shared_session: Optional[aiohttp.ClientSession] = None
+    ) -> BaseExchange:
         """
         Create an exchange instance from configuration.
 
@@ -30,6 +43,8 @@ class ExchangeFactory:
                 - api_base_url: Base URL for the API
                 Optional keys:
                 - config: Exchange-specific configuration
+            shared_session: HTTP session shared across exchanges (optional).
+                The caller remains responsible for closing it.
 
         Returns:
             BaseExchange: Exchange instance
@@ -44,17 +59,61 @@ class ExchangeFactory:
 
         exchange_type = config['type']
 
-        # Check if exchange type is registered
-        if exchange_type not in cls._registry:
+        # Look up the exchange class (single lookup) and create instance
+        exchange_class = cls._registry.get(exchange_type)
+        if exchange_class is None:
             available_types = ', '.join(cls._registry.keys())
             raise ValueError(
                 f"Unknown exchange type: '{exchange_type}'. "
                 f"Available types: {available_types}"
             )
 
-        # Get the exchange class and create instance
-        exchange_class = cls._registry[exchange_type]
-        return exchange_class(config)
+        return exchange_class(config, session=shared_session)
+
+    @classmethod
+    async def fetch_all_markets(
+        cls,
+        exchanges: List[BaseExchange]
+    ) -> Dict[str, List[MarketData]]:
+        """
+        Fetch markets from all exchanges concurrently.
+
+        Total time is bounded by the slowest exchange rather than the sum
+        of all of them. Exchanges that fail are logged and left out of the
+        result so callers can continue with the others.
+
+        Args:
+            exchanges: Exchange instances to poll
+
+        Returns:
+            Dict[str, List[MarketData]]: Markets keyed by exchange name,
+                in the same order as `exchanges`
+
+        Raises:
+            BaseException: Cancellation (or another non-Exception error)
+                raised while fetching from an exchange
+        """
+        for exchange in exchanges:
+            logger.info(f"Fetching markets from {exchange.name}...")
+
+        results = await asyncio.gather(
+            *(exchange.get_markets() for exchange in exchanges),
+            return_exceptions=True
+        )
+
+        markets_by_exchange = {}
+        for exchange, result in zip(exchanges, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch markets from {exchange.name}: {result}")
+                continue
+            if isinstance(result, BaseException):
+                # Cancellation and interpreter exit are not fetch failures
+                raise result
+
+            logger.info(f"Fetched {len(result)} markets from {exchange.name}")
+            markets_by_exchange[exchange.name] = result
+
+        return markets_by_exchange
 
     @classmethod
     def register(cls, exchange_type: str, exchange_class: Type[BaseExchange]):
@@ -70,7 +129,13 @@ class ExchangeFactory:
 
         Raises:
             TypeError: If exchange_class does not inherit from BaseExchange
+            RuntimeError: If the registry has been frozen
         """
+        if cls.is_frozen():
+            raise RuntimeError(
+                f"Cannot register '{exchange_type}': exchange registry is frozen"
+            )
+
         # Validate that exchange_class inherits from BaseExchange
         if not issubclass(exchange_class, BaseExchange):
             raise TypeError(
@@ -80,6 +145,28 @@ class ExchangeFactory:
 
         cls._registry[exchange_type] = exchange_class
 
+    @classmethod
+    def freeze(cls) -> None:
+        """
+        Make the registry read-only.
+
+        Called once at startup after all exchanges are registered so the
+        set of exchange types cannot change while the bot is running.
+        Calling it again has no effect.
+        """
+        if not cls.is_frozen():
+            cls._registry = MappingProxyType(dict(cls._registry))
+
+    @classmethod
+    def is_frozen(cls) -> bool:
+        """
+        Check whether the registry has been frozen.
+
+        Returns:
+            bool: True if freeze() has been called
+        """
+        return isinstance(cls._registry, MappingProxyType)
+
     @classmethod
     def get_registered_types(cls) -> list:
         """
@@ -188,6 +275,17 @@ def _test_factory():
     except TypeError as e:
         print(f"  ✓ Correctly raised TypeError: {e}")
 
+    # Test freeze()
+    print("\nTesting freeze():")
+    ExchangeFactory.freeze()
+    try:
+        ExchangeFactory.register('mock2', MockExchange)
+        print("  ERROR: Should have raised RuntimeError")
+    except RuntimeError as e:
+        print(f"  ✓ Correctly raised RuntimeError: {e}")
+    exchange_mock = ExchangeFactory.create(config_mock)
+    print(f"  Created after freeze: {exchange_mock.name}")
+
     print("\n✓ All tests passed!")
 
 
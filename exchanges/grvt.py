@@ -7,18 +7,148 @@ GitHub SDK: https://github.com/gravity-technologies/grvt-pysdk
 
 import aiohttp
 import asyncio
-from typing import List, Dict, Optional
-from .base import BaseExchange
+import functools
+import re
+import msgspec
+from typing import Any, Generic, List, Dict, Optional, TypeVar, Union
+from .base import BaseExchange, retry_backoff, single_flight
 from core.types import MarketData
+from core.http_utils import JSON_HEADERS
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Tickerの数値フィールド（文字列・数値・空文字列・欠損のいずれもあり得る）
+_Number = Union[float, str, None]
+
+# "_USDT_Perp" / "_USDC_Perp" → "_USD"、単独の "_Perp" は削除
+_GRVT_SUFFIX_PATTERN = re.compile(r'([_-]USD)[TC](?:_Perp)?$|_Perp$')
+# アンダースコアをハイフンに置換
+_GRVT_SEPARATOR_TABLE = str.maketrans('_', '-')
+
+
+class GRVTResponse(msgspec.Struct, Generic[T]):
+    """GRVT APIレスポンスの共通エンベロープ"""
+    result: Optional[T] = None
+    code: Optional[int] = None      # エラー時のみ設定される
+    message: Optional[str] = None
+
+
+class GRVTInstrument(msgspec.Struct):
+    """
+    GRVT Instrumentのうち使用するフィールド
+
+    その他のフィールドはデコード時に読み飛ばされ、dictは生成されない。
+    """
+    instrument: str
+    settlement_period: Optional[str] = None
+
+
+class GRVTTicker(msgspec.Struct):
+    """
+    GRVT Tickerのうち使用するフィールド
+
+    APIは数値を文字列で返す。空文字列でもデコードに失敗しないよう型は緩くし、
+    floatへの変換は_parse_grvt_marketで行う。
+    """
+    buy_volume_24h_q: _Number = None
+    sell_volume_24h_q: _Number = None
+    funding_rate_8h_curr: _Number = None
+    open_interest: _Number = None
+    mark_price: _Number = None
+    last_price: _Number = None
+
+
+def _to_float(value: _Number) -> float:
+    """
+    Tickerの数値フィールドをfloatに変換（欠損値・空文字列は0として扱う）
+
+    Args:
+        value: 数値フィールドの値
+
+    Returns:
+        float: 変換後の値
+
+    Raises:
+        ValueError: 数値として解釈できない文字列の場合
+    """
+    return float(value or 0)
+
+
+def _parse_grvt_market(
+    instrument: GRVTInstrument,
+    ticker: GRVTTicker,
+    exchange_name: str
+) -> Optional[MarketData]:
+    """
+    InstrumentとTickerからMarketDataを生成
+
+    欠損値・空文字列は0として扱う。
+
+    Args:
+        instrument: Instrument情報
+        ticker: Ticker情報
+        exchange_name: 取引所名
+
+    Returns:
+        Optional[MarketData]: マーケットデータ、パースに失敗した場合はNone
+    """
+    try:
+        # 24h取引量（USD）= Buy Volume + Sell Volume (quote asset)
+        volume_24h = _to_float(ticker.buy_volume_24h_q) + _to_float(ticker.sell_volume_24h_q)
+
+        # Funding Rate (percentage points → decimal)
+        # GRVTは既にパーセンテージポイント（0.01% = "0.01"）で返すため、100で割る
+        funding_rate = _to_float(ticker.funding_rate_8h_curr) / 100  # 0.01% → 0.0001
+
+        # Open Interest（base asset → USD換算）
+        open_interest = _to_float(ticker.open_interest) * _to_float(ticker.mark_price)
+
+        # 最終価格
+        last_price = _to_float(ticker.last_price)
+    except ValueError as e:
+        logger.warning(f"Failed to parse market data for {instrument.instrument}: {e}")
+        return None
+
+    return MarketData(
+        symbol=_normalize_grvt_symbol(instrument.instrument),
+        exchange=exchange_name,
+        volume_24h=volume_24h,
+        funding_rate=funding_rate,
+        open_interest=open_interest,
+        last_price=last_price if last_price > 0 else None
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_grvt_symbol(raw_symbol: str) -> str:
+    """
+    GRVTのシンボルを正規化（結果はキャッシュされる）
+
+    銘柄数は少なくポーリング間で変わらないため、同じ文字列の変換は一度だけ行う。
+
+    Args:
+        raw_symbol: 取引所のシンボル形式（例: "BTC_USDT_Perp"）
+
+    Returns:
+        str: 正規化されたシンボル (例: 'BTC-USD')
+    """
+    # GRVTのフォーマット: "BTC_USDT_Perp", "ETH_USDC_Perp"
+    # "_Perp"サフィックスの削除とUSDT/USDC→USDの統一を1回の置換で行う
+    # "BTC_USDT_Perp" → "BTC_USD"
+    symbol = _GRVT_SUFFIX_PATTERN.sub(r'\1', raw_symbol, count=1)
+
+    # アンダースコアをハイフンに置換
+    # "BTC_USD" → "BTC-USD"
+    return symbol.translate(_GRVT_SEPARATOR_TABLE).upper()
+
 
 class GRVTExchange(BaseExchange):
     """GRVT取引所クラス"""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         """
         初期化
 
@@ -27,53 +157,76 @@ class GRVTExchange(BaseExchange):
                 - name: 取引所名
                 - api_base_url: APIベースURL (https://market-data.grvt.io)
                 - config.rate_limit: レート制限（オプション）
+                - config.max_concurrent_tickers: Ticker同時取得数の上限（オプション）
+            session: 共有HTTPセッション（オプション）
         """
-        super().__init__(config)
+        super().__init__(config, session)
         self.rate_limit = config.get('config', {}).get('rate_limit', 500)
-        self._session: Optional[aiohttp.ClientSession] = None
+        self.max_concurrent_tickers = self.config.get('max_concurrent_tickers', 20)
+        # Ticker取得の同時実行数を制限
+        self._ticker_semaphore = asyncio.Semaphore(self.max_concurrent_tickers)
+        # 接続・読み取りの停滞は短いタイムアウトで検知し、全体の上限は30秒
+        self.timeout = aiohttp.ClientTimeout(total=30, connect=3, sock_read=10)
+        # リトライ（0.25秒から倍々、上限2秒）で一時的な障害は1秒前後で回復させる
+        self.max_retries = 3
+        self.retry_delay = 0.25
+        self.max_retry_delay = 2.0
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """HTTPセッションを取得（再利用）"""
         if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self._session = aiohttp.ClientSession(
+            # 接続プールの上限をセマフォに合わせる
+            connector = aiohttp.TCPConnector(limit_per_host=self.max_concurrent_tickers)
+            return self._adopt_session(aiohttp.ClientSession(
                 headers={"Content-Type": "application/json"},
-                timeout=timeout
-            )
+                timeout=self.timeout,
+                connector=connector
+            ))
         return self._session
 
-    async def close(self):
-        """セッションをクローズ"""
-        if self._session and not self._session.closed:
-            await self._session.close()
-
-    async def _post_request(self, endpoint: str, data: Dict) -> Dict:
+    async def _post_request(self, endpoint: str, data: Dict, result_type: Any = Any) -> GRVTResponse:
         """
         POSTリクエストを送信
 
         Args:
             endpoint: エンドポイントパス
             data: リクエストボディ
+            result_type: レスポンスの`result`をデコードする型
 
         Returns:
-            Dict: レスポンスJSON
+            GRVTResponse: デコード済みレスポンス
 
         Raises:
             aiohttp.ClientError: API呼び出し失敗時
+            msgspec.ValidationError: レスポンスが期待する型と一致しない場合
         """
         session = await self._get_session()
         url = f"{self.api_base_url}{endpoint}"
 
-        max_retries = 3
+        # リクエストボディは一度だけエンコードし、リトライ時も再利用する
+        payload = msgspec.json.encode(data)
+
+        max_retries = self.max_retries
         for attempt in range(max_retries):
             try:
-                async with session.post(url, json=data) as response:
+                # 共有セッション使用時もGRVT用のタイムアウトを適用する
+                async with session.post(
+                    url,
+                    data=payload,
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout
+                ) as response:
                     response.raise_for_status()
-                    result = await response.json()
+                    body = await response.read()
+                    result = msgspec.json.decode(
+                        body,
+                        type=GRVTResponse[result_type],
+                        strict=False
+                    )
 
                     # エラーレスポンスのチェック
-                    if result.get('code'):
-                        error_msg = result.get('message', 'Unknown error')
+                    if result.code:
+                        error_msg = result.message or 'Unknown error'
                         logger.error(f"GRVT API error: {error_msg}")
                         raise ValueError(f"API error: {error_msg}")
 
@@ -81,12 +234,13 @@ class GRVTExchange(BaseExchange):
 
             except aiohttp.ClientError as e:
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # exponential backoff
-                    logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time}s...")
+                    wait_time = retry_backoff(attempt, self.retry_delay, self.max_retry_delay)  # ジッター付き指数バックオフ
+                    logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time:.2f}s...")
                     await asyncio.sleep(wait_time)
                 else:
                     raise
 
+    @single_flight
     async def get_markets(self) -> List[MarketData]:
         """
         全マーケット情報を取得
@@ -103,15 +257,16 @@ class GRVTExchange(BaseExchange):
             # Step 1: 全銘柄リストを取得
             instruments_response = await self._post_request(
                 "/full/v1/all_instruments",
-                {"is_active": True}
+                {"is_active": True},
+                List[GRVTInstrument]
             )
 
-            instruments = instruments_response.get('result', [])
+            instruments = instruments_response.result or []
 
             # PERPETUAL銘柄のみフィルタリング
             perp_instruments = [
                 inst for inst in instruments
-                if inst.get('settlement_period') == 'PERPETUAL'
+                if inst.settlement_period == 'PERPETUAL'
             ]
 
             logger.info(f"Found {len(perp_instruments)} PERPETUAL instruments out of {len(instruments)} total")
@@ -122,29 +277,25 @@ class GRVTExchange(BaseExchange):
 
             # Step 2: 各銘柄のTickerを並列取得
             ticker_tasks = [
-                self._fetch_ticker(inst['instrument'])
+                self._fetch_ticker(inst.instrument)
                 for inst in perp_instruments
             ]
 
             tickers = await asyncio.gather(*ticker_tasks, return_exceptions=True)
 
             # Step 3: データを統合
-            market_list = []
-            for inst, ticker in zip(perp_instruments, tickers):
-                if isinstance(ticker, Exception):
-                    logger.warning(f"Failed to fetch ticker for {inst['instrument']}: {ticker}")
-                    continue
-
-                if ticker is None:
-                    continue
-
-                try:
-                    market_data = self._parse_market_data(inst, ticker)
-                    if market_data:
-                        market_list.append(market_data)
-                except Exception as e:
-                    logger.warning(f"Failed to parse market data for {inst['instrument']}: {e}")
-                    continue
+            # 取得失敗（_fetch_tickerでログ出力済み）を先に除外してから変換する
+            # 想定外の例外は外側のtryで扱う
+            pairs = [
+                (inst, ticker) for inst, ticker in zip(perp_instruments, tickers)
+                if ticker is not None and not isinstance(ticker, BaseException)
+            ]
+            parse = _parse_grvt_market
+            exchange_name = self.name
+            market_list = [
+                market for inst, ticker in pairs
+                if (market := parse(inst, ticker, exchange_name)) is not None
+            ]
 
             logger.info(f"Successfully fetched {len(market_list)} markets from {self.name}")
             return market_list
@@ -156,7 +307,7 @@ class GRVTExchange(BaseExchange):
             logger.error(f"Unexpected error in get_markets for {self.name}: {e}")
             raise
 
-    async def _fetch_ticker(self, instrument: str) -> Optional[Dict]:
+    async def _fetch_ticker(self, instrument: str) -> Optional[GRVTTicker]:
         """
         個別銘柄のTicker情報を取得
 
@@ -164,65 +315,20 @@ class GRVTExchange(BaseExchange):
             instrument: 銘柄名（例: "BTC_USDT_Perp"）
 
         Returns:
-            Optional[Dict]: Ticker情報、エラー時はNone
+            Optional[GRVTTicker]: Ticker情報、エラー時はNone
         """
         try:
-            response = await self._post_request(
-                "/full/v1/ticker",
-                {"instrument": instrument}
-            )
-            return response.get('result')
+            async with self._ticker_semaphore:
+                response = await self._post_request(
+                    "/full/v1/ticker",
+                    {"instrument": instrument},
+                    GRVTTicker
+                )
+            return response.result
         except Exception as e:
             logger.warning(f"Failed to fetch ticker for {instrument}: {e}")
             return None
 
-    def _parse_market_data(self, instrument: Dict, ticker: Dict) -> Optional[MarketData]:
-        """
-        InstrumentとTickerからMarketDataを生成
-
-        Args:
-            instrument: Instrument情報
-            ticker: Ticker情報
-
-        Returns:
-            Optional[MarketData]: マーケットデータ、パースに失敗した場合はNone
-        """
-        try:
-            # シンボル正規化
-            raw_symbol = instrument['instrument']
-            symbol = self.normalize_symbol(raw_symbol)
-
-            # 24h取引量（USD）= Buy Volume + Sell Volume (quote asset)
-            buy_volume_q = float(ticker.get('buy_volume_24h_q') or 0)
-            sell_volume_q = float(ticker.get('sell_volume_24h_q') or 0)
-            volume_24h = buy_volume_q + sell_volume_q
-
-            # Funding Rate (percentage points → decimal)
-            # GRVTは既にパーセンテージポイント（0.01% = "0.01"）で返すため、100で割る
-            funding_rate_str = ticker.get('funding_rate_8h_curr') or '0'
-            funding_rate = float(funding_rate_str) / 100  # 0.01% → 0.0001
-
-            # Open Interest（base asset → USD換算）
-            oi_base = float(ticker.get('open_interest') or 0)
-            mark_price = float(ticker.get('mark_price') or 0)
-            open_interest = oi_base * mark_price
-
-            # 最終価格
-            last_price = float(ticker.get('last_price') or 0)
-
-            return MarketData(
-                symbol=symbol,
-                exchange=self.name,
-                volume_24h=volume_24h,
-                funding_rate=funding_rate,
-                open_interest=open_interest,
-                last_price=last_price if last_price > 0 else None
-            )
-
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Failed to parse market data for {instrument.get('instrument')}: {e}")
-            return None
-
     def normalize_symbol(self, raw_symbol: str) -> str:
         """
         取引所固有のシンボル形式を正規化
@@ -240,24 +346,7 @@ class GRVTExchange(BaseExchange):
             >>> exchange.normalize_symbol('ETH_USDC_Perp')
             'ETH-USD'
         """
-        # GRVTのフォーマット: "BTC_USDT_Perp", "ETH_USDC_Perp"
-        # "_Perp"サフィックスを削除
-        if raw_symbol.endswith('_Perp'):
-            raw_symbol = raw_symbol[:-5]  # "_Perp" を削除
-
-        # アンダースコアをハイフンに置換
-        # "BTC_USDT" → "BTC-USDT"
-        symbol = raw_symbol.replace('_', '-')
-
-        # USDTやUSDCをUSDに統一
-        # "BTC-USDT" → "BTC-USD"
-        # "ETH-USDC" → "ETH-USD"
-        if symbol.endswith('-USDT'):
-            symbol = symbol[:-5] + '-USD'
-        elif symbol.endswith('-USDC'):
-            symbol = symbol[:-5] + '-USD'
-
-        return symbol.upper()
+        return _normalize_grvt_symbol(raw_symbol)
 
 
 # テスト用コード
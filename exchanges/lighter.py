@@ -1,32 +1,152 @@
 """Lighter Exchange implementation for the Perp DEX Discord Bot."""
 
 import asyncio
+import functools
 import logging
-from typing import List, Dict, Optional
+import time
+from typing import Any, List, Dict, Optional
 import aiohttp
-from .base import BaseExchange
+import msgspec
+from .base import BaseExchange, retry_backoff, single_flight
 from core.types import MarketData
+from core.http_utils import create_connector, parse_retry_after
 
 
 logger = logging.getLogger(__name__)
 
 
+class LighterOrderBook(msgspec.Struct):
+    """
+    Fields of a Lighter order book details entry used by the bot.
+
+    Numeric strings are converted to numbers during decoding (strict=False).
+    """
+    symbol: Optional[str] = None
+    market_id: Optional[int] = None
+    status: Optional[str] = None
+    daily_quote_token_volume: Optional[float] = None
+    open_interest: Optional[float] = None
+    last_trade_price: Optional[float] = None
+
+
+class LighterOrderBookResponse(msgspec.Struct):
+    """
+    Response of the orderBookDetails endpoint.
+
+    Entries are kept raw and decoded one by one, so a malformed entry only
+    drops that market.
+    """
+    code: Optional[int] = None
+    order_book_details: List[msgspec.Raw] = []
+
+
+class LighterFundingRate(msgspec.Struct):
+    """Fields of a Lighter funding rate entry used by the bot."""
+    market_id: Optional[int] = None
+    rate: Optional[float] = None
+
+
+class LighterFundingRatesResponse(msgspec.Struct):
+    """Response of the funding-rates endpoint (entries decoded one by one)."""
+    code: Optional[int] = None
+    funding_rates: List[msgspec.Raw] = []
+
+
+def _decode_entries(entries: List[msgspec.Raw], entry_type: Any) -> List[Any]:
+    """
+    Decode raw response entries, skipping the ones that fail validation.
+
+    Args:
+        entries: Raw JSON entries from a response array
+        entry_type: msgspec type to decode each entry into
+
+    Returns:
+        List[Any]: Successfully decoded entries
+    """
+    decoded = []
+    for entry in entries:
+        try:
+            decoded.append(msgspec.json.decode(entry, type=entry_type, strict=False))
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            logger.debug("Skipping malformed Lighter %s entry: %s", entry_type.__name__, e)
+    return decoded
+
+
+# Forex pairs that already include the quote currency (EURUSD -> EUR-USD)
+_FOREX_NORMALIZED = {
+    pair: f"{pair[:3]}-{pair[3:]}"
+    for pair in ('EURUSD', 'GBPUSD', 'USDJPY', 'USDCAD', 'USDCHF')
+}
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_lighter_symbol(raw_symbol: str) -> str:
+    """
+    Normalize a Lighter symbol, caching the result.
+
+    Args:
+        raw_symbol: Lighter symbol (e.g., "BTC", "EURUSD")
+
+    Returns:
+        str: Normalized symbol (e.g., "BTC-USD", "EUR-USD")
+    """
+    # Lighter uses base token only, append -USD for standardization.
+    # Symbols almost always arrive uppercase, so skip the copy in that case
+    symbol = raw_symbol if raw_symbol.isupper() else raw_symbol.upper()
+
+    # Forex pairs already include the quote currency, just add a hyphen;
+    # crypto pairs get -USD appended
+    return _FOREX_NORMALIZED.get(symbol) or f"{symbol}-USD"
+
+
 class LighterExchange(BaseExchange):
     """Lighter Exchange (zkSync) implementation."""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize Lighter Exchange.
 
         Args:
             config: Exchange configuration dictionary
+            session: Shared HTTP session (optional)
         """
-        super().__init__(config)
+        super().__init__(config, session)
         self.rate_limit = self.config.get('rate_limit', 500)
         self.timeout = aiohttp.ClientTimeout(total=30)
         self.max_retries = 3
         self.retry_delay = 1  # Initial retry delay in seconds
+        self.max_retry_delay = 30.0  # Upper bound for backoff and Retry-After
+
+        # Short-lived response caches (seconds); on a failed refresh the
+        # previous result is served instead of an empty one, as long as it
+        # is younger than the max age
+        self.order_book_ttl = self.config.get('order_book_ttl', 30)
+        self.funding_rates_ttl = self.config.get('funding_rates_ttl', 300)
+        self.order_book_max_age = self.config.get('order_book_max_age', 3 * self.order_book_ttl)
+        self.funding_rates_max_age = self.config.get('funding_rates_max_age', 3 * self.funding_rates_ttl)
+        self._order_book_cache: Optional[List[LighterOrderBook]] = None
+        self._order_book_fetched = 0.0
+        self._order_book_expiry = 0.0
+        self._funding_rates_cache: Optional[Dict[int, float]] = None
+        self._funding_rates_fetched = 0.0
+        self._funding_rates_expiry = 0.0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, creating it on first use.
 
+        Returns:
+            aiohttp.ClientSession: Session reused across requests
+        """
+        if self._session is None or self._session.closed:
+            connector = create_connector(limit=64, limit_per_host=8)
+            return self._adopt_session(aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector
+            ))
+        return self._session
+
+    @single_flight
     async def get_markets(self) -> List[MarketData]:
         """
         Fetch all market information from Lighter Exchange.
@@ -34,113 +154,167 @@ class LighterExchange(BaseExchange):
         Returns:
             List[MarketData]: List of market data objects
         """
-        # Fetch order book details (includes volume, OI, price)
-        order_book_details = await self._fetch_order_book_details()
+        # Fetch order book details (includes volume, OI, price) and funding
+        # rates concurrently; both helpers handle their own errors
+        order_book_details, funding_rates = await asyncio.gather(
+            self._fetch_order_book_details(),
+            self._fetch_funding_rates()
+        )
         if not order_book_details:
             return []
 
-        # Fetch funding rates
-        funding_rates = await self._fetch_funding_rates()
-
-        # Merge data
-        markets = []
-        for details in order_book_details:
-            try:
-                parsed_market = self._parse_market(details, funding_rates)
-                if parsed_market:
-                    markets.append(parsed_market)
-            except Exception as e:
-                logger.warning(f"Failed to parse market {details.get('symbol')}: {e}")
-                continue
+        # Merge data; invalid entries come back as None
+        markets = [
+            parsed_market for details in order_book_details
+            if (parsed_market := self._parse_market(details, funding_rates)) is not None
+        ]
 
         logger.info(f"Successfully fetched {len(markets)} markets from Lighter")
         return markets
 
-    async def _fetch_order_book_details(self) -> List[Dict]:
+    async def _get_json(self, endpoint: str, response_type: Any) -> Optional[Any]:
         """
-        Fetch order book details from Lighter API.
+        GET a Lighter API endpoint and decode the JSON response into a typed struct.
+
+        Connection errors and 5xx responses are retried with jittered
+        exponential backoff; 429 responses honour Retry-After, capped at
+        `max_retry_delay`. Other 4xx responses are not retried.
+
+        Args:
+            endpoint: Endpoint path relative to the API base URL
+                (e.g., "orderBookDetails")
+            response_type: msgspec type to decode the response body into
 
         Returns:
-            List[Dict]: List of order book details
+            Optional[Any]: Decoded response, or None if the request or
+                decoding failed
         """
-        url = f"{self.api_base_url}/orderBookDetails"
+        url = f"{self.api_base_url}/{endpoint}"
 
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.get(url) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                        # Validate response code
-                        if data.get('code') != 200:
-                            logger.warning(f"Lighter API returned non-200 code: {data.get('code')}")
-                            return []
-
-                        return data.get('order_book_details', [])
+                session = await self._get_session()
+                async with session.get(url) as response:
+                    status = response.status
+                    if status == 429:
+                        # Rate limited: retry after the server-provided delay
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    elif 400 <= status < 500:
+                        # Other client errors will not succeed on retry
+                        logger.error(f"Lighter {endpoint} request failed with status {status}, not retrying")
+                        return None
+                    response.raise_for_status()
+                    body = await response.read()
+                    return msgspec.json.decode(body, type=response_type, strict=False)
 
             except aiohttp.ClientError as e:
-                logger.warning(f"Lighter orderBookDetails request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
+                logger.warning(f"Lighter {endpoint} request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
-                    logger.info(f"Retrying in {delay} seconds...")
+                    if retry_after is not None:
+                        delay = min(retry_after, self.max_retry_delay)
+                    else:
+                        # Jittered exponential backoff
+                        delay = retry_backoff(attempt, self.retry_delay, self.max_retry_delay)
+                    logger.info(f"Retrying in {delay:.2f} seconds...")
                     await asyncio.sleep(delay)
                 else:
-                    logger.error(f"Lighter orderBookDetails request failed after {self.max_retries} attempts")
-                    return []
+                    logger.error(f"Lighter {endpoint} request failed after {self.max_retries} attempts")
+                    return None
             except Exception as e:
-                logger.error(f"Unexpected error fetching Lighter order book details: {e}")
-                return []
+                logger.error(f"Unexpected error fetching Lighter {endpoint}: {e}")
+                return None
 
-        return []
+        return None
+
+    async def _fetch_order_book_details(self) -> List[LighterOrderBook]:
+        """
+        Fetch order book details from Lighter API.
+
+        Results are cached for `order_book_ttl` seconds. If a refresh fails,
+        the cached result is used until it is `order_book_max_age` seconds old.
+
+        Returns:
+            List[LighterOrderBook]: List of order book details
+        """
+        if time.monotonic() < self._order_book_expiry:
+            return self._order_book_cache
+
+        data = await self._get_json("orderBookDetails", LighterOrderBookResponse)
+
+        # Validate response code
+        if data is not None and data.code != 200:
+            logger.warning(f"Lighter API returned non-200 code: {data.code}")
+            data = None
+
+        if data is None:
+            if self._order_book_cache is not None:
+                age = time.monotonic() - self._order_book_fetched
+                if age <= self.order_book_max_age:
+                    logger.warning("Using previously fetched Lighter order book details")
+                    return self._order_book_cache
+                logger.error(f"Cached Lighter order book details are too old to use ({age:.0f}s)")
+            return []
+
+        self._order_book_cache = _decode_entries(data.order_book_details, LighterOrderBook)
+        self._order_book_fetched = time.monotonic()
+        self._order_book_expiry = self._order_book_fetched + self.order_book_ttl
+        return self._order_book_cache
 
     async def _fetch_funding_rates(self) -> Dict[int, float]:
         """
         Fetch funding rates from Lighter API.
 
+        Results are cached for `funding_rates_ttl` seconds. If a refresh fails,
+        the cached result is used until it is `funding_rates_max_age` seconds old.
+
         Returns:
             Dict[int, float]: Mapping of market_id to funding rate
         """
-        url = f"{self.api_base_url}/funding-rates"
+        if time.monotonic() < self._funding_rates_expiry:
+            return self._funding_rates_cache
+
+        funding_map = await self._fetch_funding_map()
+
+        if funding_map is None:
+            if self._funding_rates_cache is not None:
+                age = time.monotonic() - self._funding_rates_fetched
+                if age <= self.funding_rates_max_age:
+                    logger.warning("Using previously fetched Lighter funding rates")
+                    return self._funding_rates_cache
+                logger.error(f"Cached Lighter funding rates are too old to use ({age:.0f}s)")
+            return {}
+
+        self._funding_rates_cache = funding_map
+        self._funding_rates_fetched = time.monotonic()
+        self._funding_rates_expiry = self._funding_rates_fetched + self.funding_rates_ttl
+        return funding_map
+
+    async def _fetch_funding_map(self) -> Optional[Dict[int, float]]:
+        """
+        Request funding rates and build the market_id mapping.
 
-        for attempt in range(self.max_retries):
-            try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.get(url) as response:
-                        response.raise_for_status()
-                        data = await response.json()
-
-                        # Validate response code
-                        if data.get('code') != 200:
-                            logger.warning(f"Lighter funding-rates API returned non-200 code: {data.get('code')}")
-                            return {}
-
-                        # Build market_id -> funding_rate mapping
-                        funding_map = {}
-                        for fr_data in data.get('funding_rates', []):
-                            market_id = fr_data.get('market_id')
-                            rate = fr_data.get('rate')
-                            if market_id is not None and rate is not None:
-                                funding_map[market_id] = float(rate)
-
-                        return funding_map
+        Returns:
+            Optional[Dict[int, float]]: Mapping of market_id to funding rate,
+                or None if the request or response was invalid
+        """
+        data = await self._get_json("funding-rates", LighterFundingRatesResponse)
+        if data is None:
+            return None
 
-            except aiohttp.ClientError as e:
-                logger.warning(f"Lighter funding-rates request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(f"Lighter funding-rates request failed after {self.max_retries} attempts")
-                    return {}
-            except Exception as e:
-                logger.error(f"Unexpected error fetching Lighter funding rates: {e}")
-                return {}
+        # Validate response code
+        if data.code != 200:
+            logger.warning(f"Lighter funding-rates API returned non-200 code: {data.code}")
+            return None
 
-        return {}
+        # Build market_id -> funding_rate mapping (rates are already floats)
+        return {
+            market_id: rate for fr_data in _decode_entries(data.funding_rates, LighterFundingRate)
+            if (market_id := fr_data.market_id) is not None
+            and (rate := fr_data.rate) is not None
+        }
 
-    def _parse_market(self, details: Dict, funding_rates: Dict[int, float]) -> Optional[MarketData]:
+    def _parse_market(self, details: LighterOrderBook, funding_rates: Dict[int, float]) -> Optional[MarketData]:
         """
         Parse a single market from Lighter API response.
 
@@ -151,58 +325,53 @@ class LighterExchange(BaseExchange):
         Returns:
             Optional[MarketData]: Parsed market data or None if invalid
         """
-        try:
-            symbol = details.get('symbol')
-            market_id = details.get('market_id')
-            status = details.get('status')
+        symbol = details.symbol
 
-            # Only include active markets
-            if status != 'active':
-                logger.debug(f"Skipping inactive market {symbol}")
-                return None
-
-            # Extract required fields
-            daily_quote_volume = details.get('daily_quote_token_volume')
-            open_interest = details.get('open_interest')
-            last_trade_price = details.get('last_trade_price')
-
-            # Check for missing data
-            if not all([symbol, market_id is not None, daily_quote_volume, open_interest, last_trade_price]):
-                logger.debug(f"Skipping market {symbol} due to missing data")
-                return None
-
-            # Convert to floats
-            volume_24h = float(daily_quote_volume)
-            oi_quantity = float(open_interest)
-            price = float(last_trade_price)
+        # Only include active markets
+        if details.status != 'active':
+            logger.debug("Skipping inactive market %s", symbol)
+            return None
 
-            # Calculate Open Interest in USD
-            # Lighter returns OI as quantity, so multiply by last price
-            oi_usd = oi_quantity * price
+        # Numeric fields were converted to floats during decoding
+        market_id = details.market_id
+        volume_24h = details.daily_quote_token_volume
+        oi_quantity = details.open_interest
+        price = details.last_trade_price
+
+        # Check for missing data (zero volume, OI or price counts as missing)
+        if (
+            not symbol
+            or market_id is None
+            or not volume_24h
+            or not oi_quantity
+            or not price
+        ):
+            logger.debug("Skipping market %s due to missing data", symbol)
+            return None
 
-            # Get funding rate (default to 0 if not available)
-            funding_rate = funding_rates.get(market_id, 0.0)
+        # Calculate Open Interest in USD
+        # Lighter returns OI as quantity, so multiply by last price
+        oi_usd = oi_quantity * price
 
-            # Validate values
-            if volume_24h < 0 or oi_usd < 0:
-                logger.debug(f"Skipping market {symbol} due to invalid values")
-                return None
+        # Get funding rate (default to 0 if not available)
+        funding_rate = funding_rates.get(market_id, 0.0)
 
-            # Normalize symbol
-            normalized_symbol = self.normalize_symbol(symbol)
+        # Validate values
+        if volume_24h < 0 or oi_usd < 0:
+            logger.debug("Skipping market %s due to invalid values", symbol)
+            return None
 
-            return MarketData(
-                symbol=normalized_symbol,
-                exchange=self.name,
-                volume_24h=volume_24h,
-                funding_rate=funding_rate,
-                open_interest=oi_usd,
-                last_price=price
-            )
+        # Normalize symbol
+        normalized_symbol = self.normalize_symbol(symbol)
 
-        except (ValueError, TypeError) as e:
-            logger.debug(f"Error parsing market data: {e}")
-            return None
+        return MarketData(
+            symbol=normalized_symbol,
+            exchange=self.name,
+            volume_24h=volume_24h,
+            funding_rate=funding_rate,
+            open_interest=oi_usd,
+            last_price=price
+        )
 
     def normalize_symbol(self, raw_symbol: str) -> str:
         """
@@ -217,17 +386,7 @@ class LighterExchange(BaseExchange):
         Returns:
             str: Normalized symbol (e.g., "BTC-USD", "ETH-USD")
         """
-        # Lighter uses base token only, append -USD for standardization
-        raw_symbol = raw_symbol.upper()
-
-        # Handle special cases for forex pairs that already include quote currency
-        if raw_symbol in ['EURUSD', 'GBPUSD', 'USDJPY', 'USDCAD', 'USDCHF']:
-            # These are already in the right format, just add hyphen
-            # EURUSD -> EUR-USD
-            return f"{raw_symbol[:3]}-{raw_symbol[3:]}"
-
-        # For crypto pairs, append -USD
-        return f"{raw_symbol}-USD"
+        return _normalize_lighter_symbol(raw_symbol)
 
 
 # Test stub function
@@ -276,6 +435,8 @@ async def _test_lighter():
         print(f"  Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await exchange.close()
 
 
 if __name__ == '__main__':
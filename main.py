@@ -8,6 +8,7 @@ This bot monitors multiple Perpetual DEX exchanges and sends market alerts to Di
 import argparse
 import asyncio
 import logging
+import signal
 import sys
 from pathlib import Path
 
@@ -84,14 +85,9 @@ async def run_once(config_path: str):
         sys.exit(1)
     finally:
         # Clean up HTTP sessions
-        if 'bot' in locals() and bot.exchanges:
+        if 'bot' in locals():
             logger.info("Cleaning up exchange connections...")
-            for exchange in bot.exchanges:
-                if hasattr(exchange, 'close'):
-                    try:
-                        await exchange.close()
-                    except Exception as e:
-                        logger.warning(f"Error closing {exchange.name}: {e}")
+            await bot.close()
 
 
 async def run_scheduled(config_path: str):
@@ -107,6 +103,13 @@ async def run_scheduled(config_path: str):
     try:
         # Create and start scheduler
         bot = BotScheduler(config_path)
+
+        # Shut down on SIGTERM the same way as on Ctrl-C
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, bot.shutdown_event.set)
+        except NotImplementedError:
+            pass  # Not supported on Windows
+
         await bot.start()
 
     except KeyboardInterrupt:
@@ -114,6 +117,10 @@ async def run_scheduled(config_path: str):
     except Exception as e:
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued alerts and close the shared HTTP session
+        if 'bot' in locals():
+            await bot.stop()
 
 
 def parse_arguments():
@@ -240,4 +247,11 @@ async def main():
 
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    # Prefer uvloop's faster event loop; it is not available on Windows,
+    # where the default asyncio loop is used
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -2,35 +2,95 @@
 
 import asyncio
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 import aiohttp
+import orjson
+from core.http_utils import JSON_HEADERS, create_connector, parse_retry_after
 from .formatter import MessageFormatter
 
 
 logger = logging.getLogger(__name__)
 
+# Discord limits per webhook message
+_MAX_EMBEDS_PER_MESSAGE = 10
+_MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+def _embed_length(embed: Dict) -> int:
+    """
+    Count the characters Discord includes in its per-message embed limit.
+
+    Args:
+        embed: Discord embed structure
+
+    Returns:
+        int: Combined length of title, description, field, footer and author text
+    """
+    length = len(embed.get('title', '')) + len(embed.get('description', ''))
+    for field in embed.get('fields', ()):
+        length += len(field.get('name', '')) + len(field.get('value', ''))
+    length += len(embed.get('footer', {}).get('text', ''))
+    length += len(embed.get('author', {}).get('name', ''))
+    return length
+
 
 class DiscordNotifier:
     """Discord notification class for sending market alerts via webhook."""
 
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize Discord notifier.
 
         Args:
             webhook_url: Discord webhook URL
+            session: Shared HTTP session (optional). If omitted, the
+                notifier creates and owns its own session.
         """
         self.webhook_url = webhook_url
         self.timeout = aiohttp.ClientTimeout(total=10)
         self.max_retries = 2  # Maximum 2 retries as per SPECIFICATION
         self.retry_delay = 1  # Initial retry delay in seconds
+        # Exponential backoff delays, indexed by attempt
+        self._retry_delays = tuple(self.retry_delay << i for i in range(self.max_retries))
+        # Upper bound for Retry-After, so a rate limit cannot stall the
+        # worker (and close()) for long
+        self.max_retry_after = 30.0
+
+        # Background delivery: queued embeds are sent by a single worker task
+        # so callers do not wait on the webhook round trip
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self._worker_task: Optional[asyncio.Task] = None
+        # Seconds the worker waits for more embeds to combine into one message
+        self.batch_window = 0.25
+
+        # Shared session, or one created on first send and reused for
+        # every webhook request
+        self._session = session
+        self._owns_session = session is None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session, creating it on first use.
+
+        Returns:
+            aiohttp.ClientSession: Session reused across webhook requests
+        """
+        if self._session is None or self._session.closed:
+            connector = create_connector(limit=4, limit_per_host=4)
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector
+            )
+            self._owns_session = True
+        return self._session
 
     async def send_market_alert(
         self,
         fr_divergence: List[Dict],
         low_oi_ratio: List[Dict],
         exchange_names: List[str] = None,
-        base_exchange: str = None
+        base_exchange: str = None,
+        timestamp: Optional[str] = None
     ) -> bool:
         """
         Send market alert to Discord.
@@ -40,6 +100,7 @@ class DiscordNotifier:
             low_oi_ratio: Low OI ratio ranking
             exchange_names: List of enabled exchange names (for description)
             base_exchange: Base exchange name for OI analysis (optional)
+            timestamp: ISO 8601 embed timestamp (default: current UTC time)
 
         Returns:
             bool: True if sent successfully, False otherwise
@@ -49,60 +110,228 @@ class DiscordNotifier:
             fr_divergence,
             low_oi_ratio,
             exchange_names,
-            base_exchange
+            base_exchange,
+            timestamp
         )
 
         # Send to Discord
-        return await self._send_embed(embed)
+        return await self._send_embeds([embed])
 
-    async def send_error(self, error_message: str) -> bool:
+    async def send_error(self, error_message: str, timestamp: Optional[str] = None) -> bool:
         """
         Send error message to Discord.
 
         Args:
             error_message: Error message to send
+            timestamp: ISO 8601 embed timestamp (default: current UTC time)
 
         Returns:
             bool: True if sent successfully, False otherwise
         """
-        embed = MessageFormatter.format_error_message(error_message)
-        return await self._send_embed(embed)
+        embed = MessageFormatter.format_error_message(error_message, timestamp)
+        return await self._send_embeds([embed])
+
+    async def send_batched(self, embeds: List[Dict]) -> bool:
+        """
+        Send several embeds with as few webhook messages as possible.
+
+        Embeds are grouped in order into messages within Discord's limits
+        (10 embeds and 6000 embed characters per message).
 
-    async def _send_embed(self, embed: Dict) -> bool:
+        Args:
+            embeds: Discord embed structures (e.g., from MessageFormatter)
+
+        Returns:
+            bool: True if every message was sent successfully, False otherwise
         """
-        Send embed to Discord webhook with retry logic.
+        success = True
+        batch: List[Dict] = []
+        length = 0
+
+        for embed in embeds:
+            embed_length = _embed_length(embed)
+            if batch and (
+                len(batch) == _MAX_EMBEDS_PER_MESSAGE
+                or length + embed_length > _MAX_EMBED_CHARS_PER_MESSAGE
+            ):
+                success = await self._send_embeds(batch) and success
+                batch, length = [], 0
+            batch.append(embed)
+            length += embed_length
+
+        if batch:
+            success = await self._send_embeds(batch) and success
+        return success
+
+    def queue_market_alert(
+        self,
+        fr_divergence: List[Dict],
+        low_oi_ratio: List[Dict],
+        exchange_names: List[str] = None,
+        base_exchange: str = None,
+        timestamp: Optional[str] = None
+    ) -> None:
+        """
+        Queue a market alert for background delivery.
+
+        Returns immediately; delivery failures are logged by the worker.
+
+        Args:
+            fr_divergence: FR divergence ranking
+            low_oi_ratio: Low OI ratio ranking
+            exchange_names: List of enabled exchange names (for description)
+            base_exchange: Base exchange name for OI analysis (optional)
+            timestamp: ISO 8601 embed timestamp (default: current UTC time)
+        """
+        embed = MessageFormatter.format_market_alert(
+            fr_divergence,
+            low_oi_ratio,
+            exchange_names,
+            base_exchange,
+            timestamp
+        )
+        self._enqueue(embed)
+
+    def queue_error(self, error_message: str, timestamp: Optional[str] = None) -> None:
+        """
+        Queue an error message for background delivery.
+
+        Args:
+            error_message: Error message to send
+            timestamp: ISO 8601 embed timestamp (default: current UTC time)
+        """
+        self._enqueue(MessageFormatter.format_error_message(error_message, timestamp))
+
+    def _enqueue(self, embed: Dict) -> None:
+        """
+        Add an embed to the send queue, starting the worker if needed.
+
+        When the queue is full the oldest pending embed is dropped.
 
         Args:
             embed: Discord embed structure
+        """
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning("Discord send queue is full, dropped oldest message")
+
+        self._queue.put_nowait(embed)
+
+    async def _worker(self):
+        """
+        Send queued embeds until cancelled.
+
+        Embeds arriving within `batch_window` seconds of each other are
+        combined into a single webhook message, up to Discord's limits.
+        """
+        loop = asyncio.get_running_loop()
+        carry: Optional[Dict] = None
+
+        while True:
+            if carry is None:
+                embed = await self._queue.get()
+            else:
+                embed, carry = carry, None
+
+            batch = [embed]
+            length = _embed_length(embed)
+            deadline = loop.time() + self.batch_window
+            try:
+                while len(batch) < _MAX_EMBEDS_PER_MESSAGE:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        embed = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+                    # Keep an embed that would overflow the message for the next one
+                    embed_length = _embed_length(embed)
+                    if length + embed_length > _MAX_EMBED_CHARS_PER_MESSAGE:
+                        carry = embed
+                        break
+                    batch.append(embed)
+                    length += embed_length
+
+                await self._send_embeds(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def close(self):
+        """Wait for queued messages to be sent, then stop the worker and close the session if owned."""
+        if self._worker_task is not None:
+            if not self._worker_task.done():
+                await self._queue.join()
+                self._worker_task.cancel()
+                try:
+                    await self._worker_task
+                except asyncio.CancelledError:
+                    pass
+
+            self._worker_task = None
+
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        """Enter the async context; the notifier is closed on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Flush pending messages and close the notifier when leaving the async context."""
+        await self.close()
+
+    async def _send_embeds(self, embeds: List[Dict]) -> bool:
+        """
+        Send embeds to Discord webhook as one message with retry logic.
+
+        Args:
+            embeds: Discord embed structures (at most 10)
 
         Returns:
             bool: True if sent successfully, False otherwise
         """
-        payload = {
-            "embeds": [embed]
-        }
+        # Encode once; the same bytes are reused on retries
+        payload = orjson.dumps({
+            "embeds": embeds
+        })
 
         for attempt in range(self.max_retries + 1):
+            retry_after = None
             try:
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.post(
-                        self.webhook_url,
-                        json=payload
-                    ) as response:
-                        # Discord webhook returns 204 on success
-                        if response.status == 204:
-                            logger.info("Successfully sent message to Discord")
-                            return True
-                        else:
+                session = await self._get_session()
+                async with session.post(
+                    self.webhook_url,
+                    data=payload,
+                    headers=JSON_HEADERS,
+                    timeout=self.timeout
+                ) as response:
+                    # Discord webhook returns 204 on success
+                    if response.status == 204:
+                        logger.info("Successfully sent message to Discord")
+                        return True
+                    else:
+                        # Only read the error body when it will be logged
+                        if logger.isEnabledFor(logging.WARNING):
                             error_text = await response.text()
                             logger.warning(
                                 f"Discord webhook returned status {response.status}: {error_text}"
                             )
 
-                            # Don't retry on client errors (4xx)
-                            if 400 <= response.status < 500:
-                                logger.error(f"Client error, not retrying: {response.status}")
-                                return False
+                        # Rate limited: retry after the delay Discord asks for
+                        if response.status == 429:
+                            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+                        # Don't retry on other client errors (4xx)
+                        elif 400 <= response.status < 500:
+                            logger.error(f"Client error, not retrying: {response.status}")
+                            return False
 
             except aiohttp.ClientError as e:
                 logger.warning(
@@ -115,7 +344,11 @@ class DiscordNotifier:
 
             # Retry logic
             if attempt < self.max_retries:
-                delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                # Honor Retry-After (capped) when rate limited, otherwise exponential backoff
+                if retry_after is not None:
+                    delay = min(retry_after, self.max_retry_after)
+                else:
+                    delay = self._retry_delays[attempt]
                 logger.info(f"Retrying in {delay} seconds...")
                 await asyncio.sleep(delay)
             else:
@@ -207,6 +440,8 @@ async def _test_discord():
     else:
         print("  ✗ Failed to send empty alert (this is expected with dummy URL)")
 
+    await notifier.close()
+
     print("\n✓ Tests completed!")
     print("\nTo test with actual Discord:")
     print("1. Create a Discord webhook in your server")
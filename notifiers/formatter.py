@@ -1,12 +1,57 @@
 """Message formatting for Discord notifications."""
 
+import functools
 import logging
-from typing import List, Dict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import List, Dict, Optional
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
+# Row templates for the ranking tables, bound once to str.format.
+# FR row: rank, symbol, exchange A (truncated to 8), FR A, exchange B, FR B, FR diff
+_FR_ROW = "{0:4d} | {1:9s} | {2:8.8s} {3:<+7.3%} | {4:8.8s} {5:<+7.3%} | {6:<7.3%}".format
+# OI row: rank, symbol, volume, open interest, OI/volume ratio
+_OI_ROW = "{0:4d} | {1:9s} | {2:12s} | {3:13s} | {4:<12.2f}".format
+
+# Extract each ranking item's row fields in one call, in template order
+_FR_FIELDS = itemgetter('symbol', 'exchange_a', 'fr_a', 'exchange_b', 'fr_b', 'fr_diff')
+_OI_FIELDS = itemgetter('symbol', 'volume_24h', 'open_interest', 'oi_volume_ratio')
+
+# Fixed parts of each embed; per-call values are merged into a new dict.
+# The nested footer dict is shared by every embed and must not be mutated.
+_FOOTER = {"text": "Perp DEX Discord Bot"}
+_ALERT_EMBED = MappingProxyType({
+    "title": "📊 Perp DEX マーケットアラート",
+    "color": 0x3498db,  # Blue
+    "footer": _FOOTER,
+})
+_ERROR_EMBED = MappingProxyType({
+    "title": "⚠️ エラー",
+    "color": 0xe74c3c,  # Red
+    "footer": _FOOTER,
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_scaled_usd(scaled: float, suffix: str) -> str:
+    """
+    Format a USD amount already scaled and rounded to one decimal, caching the result.
+
+    Many amounts collapse onto the same rounded value, so the string is
+    only built once per distinct output.
+
+    Args:
+        scaled: Amount divided by the suffix unit and rounded to 0.1
+        suffix: Unit suffix ("M" or "K")
+
+    Returns:
+        str: Formatted string (e.g., "$1.5M")
+    """
+    return f"${scaled:.1f}{suffix}"
+
 
 class MessageFormatter:
     """Formatter for Discord embed messages."""
@@ -16,7 +61,8 @@ class MessageFormatter:
         fr_divergence: List[Dict],
         low_oi_ratio: List[Dict],
         exchange_names: List[str] = None,
-        base_exchange: str = None
+        base_exchange: str = None,
+        timestamp: Optional[str] = None
     ) -> Dict:
         """
         Format market alert as Discord embed.
@@ -26,12 +72,14 @@ class MessageFormatter:
             low_oi_ratio: Low OI ratio ranking
             exchange_names: List of enabled exchange names (for description)
             base_exchange: Base exchange name for OI analysis (optional)
+            timestamp: ISO 8601 timestamp shared by a batch of embeds
+                (default: current UTC time)
 
         Returns:
             Dict: Discord embed structure
         """
-        # Current timestamp
-        timestamp = datetime.utcnow().isoformat()
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat()
 
         # Build description dynamically
         if exchange_names and len(exchange_names) >= 2:
@@ -43,14 +91,10 @@ class MessageFormatter:
 
         # Build embed
         embed = {
-            "title": "📊 Perp DEX マーケットアラート",
+            **_ALERT_EMBED,
             "description": description,
-            "color": 0x3498db,  # Blue
             "timestamp": timestamp,
-            "fields": [],
-            "footer": {
-                "text": "Perp DEX Discord Bot"
-            }
+            "fields": []
         }
 
         # Add FR divergence section
@@ -92,31 +136,19 @@ class MessageFormatter:
         Returns:
             Dict: Discord embed field
         """
-        lines = ["```"]
-        lines.append("順位 | ペア      | 取引所 A    | 取引所 B    | FR差分")
-        lines.append("-----|-----------|-------------|-------------|--------")
-
-        for i, item in enumerate(fr_divergence, 1):
-            symbol = item['symbol']
-            exchange_a = item['exchange_a'][:8]  # Truncate long names
-            exchange_b = item['exchange_b'][:8]
-            fr_a = item['fr_a']
-            fr_b = item['fr_b']
-            fr_diff = item['fr_diff']
-
-            # Format percentages
-            fr_a_str = f"{fr_a * 100:+.3f}%"
-            fr_b_str = f"{fr_b * 100:+.3f}%"
-            fr_diff_str = f"{fr_diff * 100:.3f}%"
+        header = (
+            "順位 | ペア      | 取引所 A    | 取引所 B    | FR差分\n"
+            "-----|-----------|-------------|-------------|--------"
+        )
 
-            line = f"{i:4d} | {symbol:9s} | {exchange_a:8s} {fr_a_str:7s} | {exchange_b:8s} {fr_b_str:7s} | {fr_diff_str:7s}"
-            lines.append(line)
-
-        lines.append("```")
+        rows = [
+            _FR_ROW(i, *fields)
+            for i, fields in enumerate(map(_FR_FIELDS, fr_divergence), 1)
+        ]
 
         return {
             "name": "💰 Funding Rate 差分（トップ機会）",
-            "value": "\n".join(lines),
+            "value": "```\n" + header + "\n" + "\n".join(rows) + "\n```",
             "inline": False
         }
 
@@ -132,25 +164,17 @@ class MessageFormatter:
         Returns:
             Dict: Discord embed field
         """
-        lines = ["```"]
-        lines.append("順位 | ペア      | 取引量(24h)  | 建玉          | OI/取引量")
-        lines.append("-----|-----------|--------------|---------------|-------------")
-
-        for i, item in enumerate(low_oi_ratio, 1):
-            symbol = item['symbol']
-            volume = item['volume_24h']
-            oi = item['open_interest']
-            ratio = item['oi_volume_ratio']
-
-            # Format large numbers with M suffix
-            volume_str = MessageFormatter._format_usd(volume)
-            oi_str = MessageFormatter._format_usd(oi)
-            ratio_str = f"{ratio:.2f}"
-
-            line = f"{i:4d} | {symbol:9s} | {volume_str:12s} | {oi_str:13s} | {ratio_str:12s}"
-            lines.append(line)
-
-        lines.append("```")
+        header = (
+            "順位 | ペア      | 取引量(24h)  | 建玉          | OI/取引量\n"
+            "-----|-----------|--------------|---------------|-------------"
+        )
+
+        # Format large numbers with M suffix
+        format_usd = MessageFormatter._format_usd
+        rows = [
+            _OI_ROW(i, symbol, format_usd(volume), format_usd(oi), ratio)
+            for i, (symbol, volume, oi, ratio) in enumerate(map(_OI_FIELDS, low_oi_ratio), 1)
+        ]
 
         # Build title with base exchange if provided
         title = "📉 低OI比率の機会（高取引量・低OI）"
@@ -159,7 +183,7 @@ class MessageFormatter:
 
         return {
             "name": title,
-            "value": "\n".join(lines),
+            "value": "```\n" + header + "\n" + "\n".join(rows) + "\n```",
             "inline": False
         }
 
@@ -174,34 +198,35 @@ class MessageFormatter:
         Returns:
             str: Formatted string (e.g., "$1.5M", "$500K")
         """
+        # round() and the .1f format round identically, so the cached
+        # string matches formatting the unrounded value
         if amount >= 1_000_000:
-            return f"${amount / 1_000_000:.1f}M"
+            return _format_scaled_usd(round(amount / 1_000_000, 1), "M")
         elif amount >= 1_000:
-            return f"${amount / 1_000:.1f}K"
+            return _format_scaled_usd(round(amount / 1_000, 1), "K")
         else:
             return f"${amount:.2f}"
 
     @staticmethod
-    def format_error_message(error_message: str) -> Dict:
+    def format_error_message(error_message: str, timestamp: Optional[str] = None) -> Dict:
         """
         Format error message as Discord embed.
 
         Args:
             error_message: Error message to display
+            timestamp: ISO 8601 timestamp shared by a batch of embeds
+                (default: current UTC time)
 
         Returns:
             Dict: Discord embed structure
         """
-        timestamp = datetime.utcnow().isoformat()
+        if timestamp is None:
+            timestamp = datetime.utcnow().isoformat()
 
         return {
-            "title": "⚠️ エラー",
+            **_ERROR_EMBED,
             "description": error_message,
-            "color": 0xe74c3c,  # Red
-            "timestamp": timestamp,
-            "footer": {
-                "text": "Perp DEX Discord Bot"
-            }
+            "timestamp": timestamp
         }
 
 
@@ -7,6 +7,7 @@ import sys
 from datetime import datetime
 from typing import List, Optional
 
+import aiohttp
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -14,7 +15,7 @@ from config_loader import ConfigLoader
 from exchanges.factory import ExchangeFactory
 from core.common_pairs import CommonPairsManager
 from core.analyzer import MarketAnalyzer
-from core.types import MarketData
+from core.types import FRConfig, MarketData, OIConfig
 from notifiers.discord import DiscordNotifier
 
 
@@ -38,6 +39,11 @@ class BotScheduler:
         self.common_pairs_manager = None
         self.analyzer = None
         self.notifier = None
+        self.fr_config: Optional[FRConfig] = None
+        self.oi_config: Optional[OIConfig] = None
+        self.exchange_names: List[str] = []
+        self.skip_empty = True
+        self.http_session: Optional[aiohttp.ClientSession] = None
         self.shutdown_event = asyncio.Event()
 
     async def initialize(self):
@@ -48,20 +54,56 @@ class BotScheduler:
         loader = ConfigLoader(self.config_path)
         self.config = loader.load()
 
+        # Analysis parameters, resolved once instead of on every job run
+        analysis_config = self.config['analysis']
+        fr_config = analysis_config['fr_divergence']
+        self.fr_config = FRConfig(
+            min_volume=fr_config['min_volume_usd'],
+            top_n=fr_config['top_n']
+        )
+        oi_config = analysis_config['oi_ratio']
+        self.oi_config = OIConfig(
+            min_volume=oi_config['min_volume_usd'],
+            max_volume=oi_config['max_volume_usd'],
+            top_n=oi_config['top_n'],
+            base_exchange=oi_config['base_exchange'],
+            max_oi_ratio=oi_config.get('max_oi_ratio', 1.0)
+        )
+        self.skip_empty = analysis_config.get('skip_empty', True)
+
         # Initialize components
         self.common_pairs_manager = CommonPairsManager(
             self.config['storage']['cache_file']
         )
         self.analyzer = MarketAnalyzer()
+
+        # One HTTP session (connection pool + DNS cache) shared by all
+        # exchanges and the Discord notifier. enable_cleanup_closed closes
+        # SSL transports left open by aborted connections on long runs
+        # (aiohttp ignores it on Python versions where this is fixed)
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=30,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+
         self.notifier = DiscordNotifier(
-            self.config['discord']['webhook_url']
+            self.config['discord']['webhook_url'],
+            session=self.http_session
         )
 
+        # No exchange types are registered after startup
+        ExchangeFactory.freeze()
+
         # Create exchange instances
         enabled_exchanges = loader.get_enabled_exchanges()
         for exchange_config in enabled_exchanges:
             try:
-                exchange = ExchangeFactory.create(exchange_config)
+                exchange = ExchangeFactory.create(exchange_config, shared_session=self.http_session)
                 self.exchanges.append(exchange)
                 logger.info(f"Initialized exchange: {exchange.name}")
             except Exception as e:
@@ -70,6 +112,7 @@ class BotScheduler:
         if not self.exchanges:
             raise RuntimeError("No exchanges initialized. Check your configuration.")
 
+        self.exchange_names = [ex.name for ex in self.exchanges]
         logger.info(f"Initialized {len(self.exchanges)} exchanges")
 
         # Setup scheduler
@@ -118,49 +161,33 @@ class BotScheduler:
 
         # Parse cron expression
         # Format: "minute hour day month day_of_week"
-        cron_parts = notification_time.split()
-        if len(cron_parts) == 5:
-            minute, hour, day, month, day_of_week = cron_parts
-            logger.info(f"Market analysis notification: {notification_time}")
-            self.scheduler.add_job(
-                self.market_analysis_job,
-                CronTrigger(
-                    minute=minute,
-                    hour=hour,
-                    day=day,
-                    month=month,
-                    day_of_week=day_of_week
-                ),
-                id='market_analysis',
-                name='Market Analysis & Notification'
-            )
-        else:
+        try:
+            trigger = CronTrigger.from_crontab(notification_time)
+        except ValueError as e:
             logger.error(f"Invalid cron expression: {notification_time}")
-            raise ValueError(f"Invalid cron expression: {notification_time}")
+            raise ValueError(f"Invalid cron expression: {notification_time}") from e
+
+        logger.info(f"Market analysis notification: {notification_time}")
+        self.scheduler.add_job(
+            self.market_analysis_job,
+            trigger,
+            id='market_analysis',
+            name='Market Analysis & Notification'
+        )
 
     async def update_common_pairs_job(self):
         """Job: Update common trading pairs."""
         logger.info("Starting common pairs update job...")
 
         try:
-            # Fetch markets from all exchanges
-            exchanges_data = []
-
-            for exchange in self.exchanges:
-                try:
-                    logger.info(f"Fetching markets from {exchange.name}...")
-                    markets = await exchange.get_markets()
-
-                    exchanges_data.append({
-                        'name': exchange.name,
-                        'markets': markets
-                    })
+            # Fetch markets from all exchanges concurrently
+            # (failed exchanges are skipped)
+            markets_by_exchange = await ExchangeFactory.fetch_all_markets(self.exchanges)
 
-                    logger.info(f"Fetched {len(markets)} markets from {exchange.name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch markets from {exchange.name}: {e}")
-                    # Continue with other exchanges
+            exchanges_data = [
+                {'name': name, 'markets': markets}
+                for name, markets in markets_by_exchange.items()
+            ]
 
             if not exchanges_data:
                 logger.error("No market data fetched from any exchange")
@@ -182,7 +209,7 @@ class BotScheduler:
                 'total_markets': sum(len(ex['markets']) for ex in exchanges_data)
             }
 
-            success = self.common_pairs_manager.save_to_cache(common_pairs, metadata)
+            success = await self.common_pairs_manager.asave_to_cache(common_pairs, metadata)
 
             if success:
                 logger.info(f"Successfully updated common pairs: {len(common_pairs)} pairs")
@@ -197,49 +224,46 @@ class BotScheduler:
         """Job: Analyze markets and send Discord notification."""
         logger.info("Starting market analysis job...")
 
+        # One timestamp for every embed produced by this run
+        timestamp = datetime.utcnow().isoformat()
+
         try:
             # Load common pairs
-            common_pairs = self.common_pairs_manager.load_from_cache()
+            common_pairs = await self.common_pairs_manager.aload_from_cache()
 
             if not common_pairs:
                 logger.warning("No common pairs in cache. Running update job first...")
                 await self.update_common_pairs_job()
-                common_pairs = self.common_pairs_manager.load_from_cache()
+                common_pairs = await self.common_pairs_manager.aload_from_cache()
 
                 if not common_pairs:
                     logger.error("Still no common pairs available. Skipping analysis.")
                     return
 
+            # The cache returns a list; use a set for O(1) membership tests below
+            common_pairs = frozenset(common_pairs)
             logger.info(f"Using {len(common_pairs)} common pairs for analysis")
 
-            # Fetch current market data from all exchanges
-            all_markets_by_exchange = {}
+            # Fetch current market data from all exchanges concurrently
+            # (failed exchanges are skipped)
+            markets_by_exchange = await ExchangeFactory.fetch_all_markets(self.exchanges)
 
-            for exchange in self.exchanges:
-                try:
-                    logger.info(f"Fetching markets from {exchange.name}...")
-                    markets_raw = await exchange.get_markets()
+            all_markets_by_exchange = {}
 
-                    # Filter to common pairs only (markets_raw already contains MarketData objects)
-                    markets = [
-                        market for market in markets_raw
-                        if market.symbol in common_pairs
-                    ]
+            for exchange_name, markets_raw in markets_by_exchange.items():
+                # Filter to common pairs only (markets_raw already contains MarketData objects)
+                markets = [
+                    market for market in markets_raw
+                    if market.symbol in common_pairs
+                ]
 
-                    all_markets_by_exchange[exchange.name] = markets
-                    logger.info(f"Fetched {len(markets)} common pair markets from {exchange.name}")
-
-                except Exception as e:
-                    logger.error(f"Failed to fetch markets from {exchange.name}: {e}")
-                    # Continue with other exchanges
+                all_markets_by_exchange[exchange_name] = markets
+                logger.info(f"Fetched {len(markets)} common pair markets from {exchange_name}")
 
             if len(all_markets_by_exchange) < 2:
                 logger.error("Need at least 2 exchanges for analysis")
                 return
 
-            # Get analysis parameters
-            analysis_config = self.config['analysis']
-
             # Analysis 1: FR divergence
             fr_divergence = []
             if len(self.exchanges) >= 2:
@@ -247,28 +271,28 @@ class BotScheduler:
                 markets_a = all_markets_by_exchange[exchange_names[0]]
                 markets_b = all_markets_by_exchange[exchange_names[1]]
 
-                fr_config = analysis_config['fr_divergence']
+                fr_config = self.fr_config
                 fr_divergence = self.analyzer.find_top_fr_divergence(
                     markets_a,
                     markets_b,
-                    min_volume=fr_config['min_volume_usd'],
-                    top_n=fr_config['top_n']
+                    min_volume=fr_config.min_volume,
+                    top_n=fr_config.top_n
                 )
 
                 logger.info(f"Found {len(fr_divergence)} FR divergence opportunities")
 
             # Analysis 2: Low OI ratio
-            oi_config = analysis_config['oi_ratio']
-            base_exchange = oi_config['base_exchange']
+            oi_config = self.oi_config
+            base_exchange = oi_config.base_exchange
 
             if base_exchange in all_markets_by_exchange:
                 base_markets = all_markets_by_exchange[base_exchange]
                 low_oi_ratio = self.analyzer.find_low_oi_ratio(
                     base_markets,
-                    min_volume=oi_config['min_volume_usd'],
-                    max_volume=oi_config['max_volume_usd'],
-                    top_n=oi_config['top_n'],
-                    max_oi_ratio=oi_config.get('max_oi_ratio', 1.0)
+                    min_volume=oi_config.min_volume,
+                    max_volume=oi_config.max_volume,
+                    top_n=oi_config.top_n,
+                    max_oi_ratio=oi_config.max_oi_ratio
                 )
 
                 logger.info(f"Found {len(low_oi_ratio)} low OI ratio opportunities")
@@ -276,29 +300,26 @@ class BotScheduler:
                 logger.warning(f"Base exchange '{base_exchange}' not found")
                 low_oi_ratio = []
 
-            # Send Discord notification
-            logger.info("Sending Discord notification...")
+            if self.skip_empty and not fr_divergence and not low_oi_ratio:
+                logger.info("No opportunities found; skipping notification")
+                return
 
-            # Get exchange names and base exchange for notification
-            exchange_names = [ex.name for ex in self.exchanges]
+            # Queue Discord notification (delivered in the background)
+            logger.info("Queueing Discord notification...")
 
-            success = await self.notifier.send_market_alert(
+            self.notifier.queue_market_alert(
                 fr_divergence,
                 low_oi_ratio,
-                exchange_names=exchange_names,
-                base_exchange=base_exchange
+                exchange_names=self.exchange_names,
+                base_exchange=base_exchange,
+                timestamp=timestamp
             )
 
-            if success:
-                logger.info("Successfully sent Discord notification")
-            else:
-                logger.error("Failed to send Discord notification")
-
         except Exception as e:
             logger.error(f"Error in market analysis job: {e}", exc_info=True)
             # Try to send error notification
             try:
-                await self.notifier.send_error(f"Market analysis job failed: {str(e)}")
+                self.notifier.queue_error(f"Market analysis job failed: {str(e)}", timestamp)
             except:
                 pass
 
@@ -325,12 +346,32 @@ class BotScheduler:
         """Stop the scheduler gracefully."""
         logger.info("Stopping scheduler...")
 
-        if self.scheduler:
+        if self.scheduler and self.scheduler.running:
             self.scheduler.shutdown(wait=True)
             logger.info("Scheduler stopped")
 
+        await self.close()
+
         self.shutdown_event.set()
 
+    async def close(self):
+        """Flush pending notifications and close HTTP sessions."""
+        if self.notifier:
+            try:
+                await self.notifier.close()
+            except Exception as e:
+                logger.warning(f"Error closing Discord notifier: {e}")
+
+        for exchange in self.exchanges:
+            if hasattr(exchange, 'close'):
+                try:
+                    await exchange.close()
+                except Exception as e:
+                    logger.warning(f"Error closing {exchange.name}: {e}")
+
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
+
     def _print_job_schedule(self):
         """Print scheduled jobs information."""
         logger.info("=" * 60)
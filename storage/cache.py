@@ -1,10 +1,13 @@
 """Cache management for the Perp DEX Discord Bot."""
 
-import json
+import asyncio
 import logging
+import os
+import time
 from typing import Any, Optional
 from pathlib import Path
 from datetime import datetime
+import orjson
 
 
 logger = logging.getLogger(__name__)
@@ -22,17 +25,21 @@ class CacheManager:
         """
         self.cache_file = Path(cache_file)
 
-    def save(self, data: Any, metadata: Optional[dict] = None) -> bool:
+    def save(self, data: Any, metadata: Optional[dict] = None, pretty: bool = False) -> bool:
         """
         Save data to cache file with timestamp.
 
         Args:
             data: Data to cache (must be JSON serializable)
             metadata: Optional metadata to include
+            pretty: Indent the JSON for easier reading when debugging
+                (the file is compact by default)
 
         Returns:
             bool: True if save was successful, False otherwise
         """
+        tmp_file = self.cache_file.with_name(self.cache_file.name + '.tmp')
+
         try:
             # Ensure parent directory exists
             self.cache_file.parent.mkdir(parents=True, exist_ok=True)
@@ -47,15 +54,24 @@ class CacheManager:
             if metadata:
                 cache_data['metadata'] = metadata
 
-            # Write to file
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            # Encode before touching the filesystem so a serialization error
+            # leaves no temporary file behind
+            payload = orjson.dumps(cache_data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+            # Write to a temporary file and swap it in, so readers never see
+            # a partial file and the mtime marks a completed write
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.cache_file)
 
             logger.info(f"Cache saved successfully to {self.cache_file}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to save cache to {self.cache_file}: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
             return False
 
     def load(self) -> Optional[dict]:
@@ -78,19 +94,45 @@ class CacheManager:
                 return None
 
             # Read from file
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = orjson.loads(self.cache_file.read_bytes())
 
             logger.info(f"Cache loaded successfully from {self.cache_file}")
             return cache_data
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse cache file {self.cache_file}: {e}")
             return None
         except Exception as e:
             logger.error(f"Failed to load cache from {self.cache_file}: {e}")
             return None
 
+    async def asave(self, data: Any, metadata: Optional[dict] = None, pretty: bool = False) -> bool:
+        """
+        Save data to cache file without blocking the event loop.
+
+        Runs save() in a worker thread.
+
+        Args:
+            data: Data to cache (must be JSON serializable)
+            metadata: Optional metadata to include
+            pretty: Indent the JSON for easier reading when debugging
+
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        return await asyncio.to_thread(self.save, data, metadata, pretty)
+
+    async def aload(self) -> Optional[dict]:
+        """
+        Load data from cache file without blocking the event loop.
+
+        Runs load() in a worker thread.
+
+        Returns:
+            Optional[dict]: Cache data, or None if cache doesn't exist or is invalid
+        """
+        return await asyncio.to_thread(self.load)
+
     def exists(self) -> bool:
         """
         Check if cache file exists.
@@ -104,21 +146,22 @@ class CacheManager:
         """
         Get age of cache in seconds.
 
+        The age is taken from the file's modification time, which save()
+        sets when the write completes, so the file is not read or parsed.
+
         Returns:
             Optional[float]: Age in seconds, or None if cache doesn't exist
         """
-        cache_data = self.load()
-        if not cache_data or 'timestamp' not in cache_data:
-            return None
-
         try:
-            cache_time = datetime.fromisoformat(cache_data['timestamp'])
-            age = (datetime.utcnow() - cache_time).total_seconds()
-            return age
-        except Exception as e:
+            mtime = self.cache_file.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        except OSError as e:
             logger.error(f"Failed to calculate cache age: {e}")
             return None
 
+        return time.time() - mtime
+
     def is_stale(self, max_age_seconds: float) -> bool:
         """
         Check if cache is stale (older than max_age_seconds).
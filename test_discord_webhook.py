@@ -10,6 +10,7 @@ import asyncio
 import os
 import sys
 from notifiers import DiscordNotifier
+from notifiers.formatter import MessageFormatter
 
 
 async def main():
@@ -31,9 +32,6 @@ async def main():
     print("Testing Discord webhook...")
     print(f"Webhook URL: {webhook_url[:50]}...")
 
-    # Create notifier
-    notifier = DiscordNotifier(webhook_url)
-
     # Sample FR divergence data
     fr_divergence = [
         {
@@ -90,30 +88,25 @@ async def main():
         }
     ]
 
-    # Send market alert
-    print("\nSending market alert...")
-    success = await notifier.send_market_alert(fr_divergence, low_oi_ratio)
+    # Send market alert and test error message together in one webhook message
+    embeds = [
+        MessageFormatter.format_market_alert(fr_divergence, low_oi_ratio),
+        MessageFormatter.format_error_message("This is a test error message from the bot")
+    ]
+
+    # One notifier (and HTTP session) for every request; closed when the block exits
+    async with DiscordNotifier(webhook_url) as notifier:
+        print("\nSending market alert and test error message...")
+        success = await notifier.send_batched(embeds)
 
     if success:
-        print("✅ Successfully sent market alert to Discord!")
+        print("✅ Successfully sent market alert and error message to Discord!")
         print("   Check your Discord channel to see the message.")
     else:
-        print("❌ Failed to send market alert")
+        print("❌ Failed to send market alert and error message")
         print("   Check the logs above for error details")
         sys.exit(1)
 
-    # Wait a bit
-    await asyncio.sleep(2)
-
-    # Send error message test
-    print("\nSending test error message...")
-    success = await notifier.send_error("This is a test error message from the bot")
-
-    if success:
-        print("✅ Successfully sent error message to Discord!")
-    else:
-        print("❌ Failed to send error message")
-
     print("\n✅ All tests completed successfully!")
 
 
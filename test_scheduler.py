@@ -8,27 +8,22 @@ This script tests the scheduler setup without actually running jobs.
 import asyncio
 import logging
 import os
+import traceback
 
 from scheduler import BotScheduler
 
 
-async def test_scheduler_initialization():
-    """Test scheduler initialization."""
+async def test_scheduler_initialization(bot: BotScheduler):
+    """
+    Test scheduler initialization.
+
+    Args:
+        bot: Initialized scheduler shared by the tests
+    """
     print("Testing Scheduler Initialization...")
     print("=" * 60)
 
-    # Set test environment variable
-    os.environ['DISCORD_WEBHOOK_URL'] = 'https://discord.com/api/webhooks/test/token'
-
     try:
-        # Create scheduler
-        bot = BotScheduler('config.yaml')
-        print("✓ BotScheduler instance created")
-
-        # Initialize (this loads config and creates exchange instances)
-        await bot.initialize()
-        print("✓ Scheduler initialized successfully")
-
         # Check components
         print(f"\nInitialized Components:")
         print(f"  - Exchanges: {len(bot.exchanges)}")
@@ -65,32 +60,31 @@ async def test_scheduler_initialization():
 
     except Exception as e:
         print(f"\n✗ Error during initialization: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
     return True
 
 
-async def test_job_functions():
-    """Test individual job functions without scheduling."""
+async def test_job_functions(bot: BotScheduler):
+    """
+    Test individual job functions without scheduling.
+
+    Args:
+        bot: Initialized scheduler shared by the tests
+    """
     print("\n\nTesting Job Functions (Manual Execution)...")
     print("=" * 60)
 
-    os.environ['DISCORD_WEBHOOK_URL'] = 'https://discord.com/api/webhooks/test/token'
-
     try:
-        bot = BotScheduler('config.yaml')
-        await bot.initialize()
-
         print("\nTest 1: Common Pairs Update Job")
         print("-" * 60)
         print("Running common pairs update job manually...")
         await bot.update_common_pairs_job()
         print("✓ Common pairs update job completed")
 
-        # Check if common pairs were saved
-        common_pairs = bot.common_pairs_manager.load_from_cache()
+        # Check if common pairs were saved (held in memory after the save)
+        common_pairs = bot.common_pairs_manager.current
         if common_pairs:
             print(f"  Found {len(common_pairs)} common pairs in cache")
             print(f"  Sample pairs: {common_pairs[:5]}")
@@ -113,7 +107,6 @@ async def test_job_functions():
 
     except Exception as e:
         print(f"\n✗ Error during job test: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -132,11 +125,31 @@ async def main():
     print("SCHEDULER TEST SUITE")
     print("=" * 60 + "\n")
 
-    # Test 1: Initialization
-    success1 = await test_scheduler_initialization()
+    # Set test environment variable once, before the tests run concurrently
+    os.environ['DISCORD_WEBHOOK_URL'] = 'https://discord.com/api/webhooks/test/token'
 
-    # Test 2: Job functions
-    success2 = await test_job_functions()
+    # Initialize once (this loads config and creates exchange instances);
+    # both tests share the same scheduler
+    bot = BotScheduler('config.yaml')
+    try:
+        await bot.initialize()
+        print("✓ Scheduler initialized successfully\n")
+    except Exception as e:
+        print(f"\n✗ Error during initialization: {e}")
+        traceback.print_exc()
+        success1 = success2 = False
+    else:
+        # Test 1: Initialization and Test 2: Job functions are independent
+        # and I/O bound, so run them concurrently (output may interleave)
+        results = await asyncio.gather(
+            test_scheduler_initialization(bot),
+            test_job_functions(bot),
+            return_exceptions=True
+        )
+        success1, success2 = (result is True for result in results)
+    finally:
+        # Release the shared HTTP session
+        await bot.close()
 
     # Summary
     print("\n\n" + "=" * 60)